@@ -14,49 +14,251 @@ print("Resume Screener API - Starting...")
 print("="*60)
 
 try:
-    from flask import Flask, render_template, jsonify, request
+    from flask import Flask, render_template, jsonify, request, Response, stream_with_context
     from flask_cors import CORS
+    import hashlib
     import json
+    import queue
+    import threading
+    import numpy as np
+    from collections import namedtuple
+    from concurrent.futures import Future
+    from functools import lru_cache
+    from uuid import uuid4
+
+    # orjson serializes several times faster than stdlib json and emits
+    # bytes directly; fall back to stdlib when it isn't installed
+    try:
+        import orjson
+
+        def json_dumps_bytes(obj):
+            return orjson.dumps(obj)
+
+        json_loads = orjson.loads
+    except Exception:
+        orjson = None
+
+        def json_dumps_bytes(obj):
+            return json.dumps(obj).encode('utf-8')
+
+        json_loads = json.loads
     
     # Create Flask app
     app = Flask(__name__, 
                 template_folder='templates',
                 static_folder='static')
     CORS(app)
-    
+
+    if orjson is not None:
+        from flask.json.provider import JSONProvider
+
+        class ORJSONProvider(JSONProvider):
+            """JSON provider backed by orjson, so jsonify/get_json use it."""
+
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(
+                    obj, option=orjson.OPT_SERIALIZE_NUMPY
+                ).decode('utf-8')
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = ORJSONProvider(app)
+
     # Initialize components lazily
     db = None
     preprocessor = None
     skill_extractor = None
     scorer = None
     embedding_generator = None
+    vector_index = None
+    vector_store = None
     
+    # Serializes lazy initialization between the preload thread and
+    # request threads; reentrant because init_embeddings needs components
+    _init_lock = threading.RLock()
+    embedding_model_ready = threading.Event()
+
     def init_components():
         """Initialize ML components only when needed."""
         global db, preprocessor, skill_extractor, scorer, embedding_generator
-        
-        if db is None:
-            print("Initializing components...")
-            from src.database import Database
-            from src.preprocessing import TextPreprocessor
-            from src.skill_extraction import SkillExtractor
-            from src.scoring import CandidateScorer
-            
-            db = Database()
-            preprocessor = TextPreprocessor(use_spacy=False)
-            skill_extractor = SkillExtractor(use_spacy=False)
-            scorer = CandidateScorer()
-            print("✓ Core components initialized")
-            
+
+        with _init_lock:
+            if db is None:
+                print("Initializing components...")
+                from src.database import Database
+                from src.preprocessing import TextPreprocessor
+                from src.skill_extraction import SkillExtractor
+                from src.scoring import CandidateScorer
+
+                db = Database()
+                preprocessor = TextPreprocessor(use_spacy=False)
+                skill_extractor = SkillExtractor(use_spacy=False)
+                scorer = CandidateScorer()
+                print("✓ Core components initialized")
+
     def init_embeddings():
         """Initialize embedding generator separately (slow)."""
-        global embedding_generator
+        global embedding_generator, vector_index, vector_store
+        with _init_lock:
+            _init_embeddings_locked()
+        embedding_model_ready.set()
+
+    def _init_embeddings_locked():
+        """Load the embedding model; must be called holding _init_lock."""
+        global embedding_generator, vector_index, vector_store
         if embedding_generator is None:
             print("Loading embedding model (this may take a moment)...")
             from src.embeddings import EmbeddingGenerator
             embedding_generator = EmbeddingGenerator()
+
+            # Start the background worker that batches embedding requests
+            worker = threading.Thread(
+                target=_embedding_worker,
+                daemon=True,
+                name='embedding-worker'
+            )
+            worker.start()
             print("✓ Embedding model loaded")
+
+            # Load (or rebuild) the ANN index over resume embeddings
+            from src.vector_index import FaissIndex
+            vector_index = FaissIndex(embedding_generator.get_embedding_dimension())
+            if len(vector_index) == 0:
+                init_components()
+                for batch in db.iter_resume_embeddings():
+                    for resume in batch:
+                        if resume.get('embedding'):
+                            vector_index.add(
+                                resume['resume_id'],
+                                embedding_generator.deserialize_embedding(resume['embedding'])
+                            )
+                if len(vector_index):
+                    vector_index.save()
+            print(f"✓ Vector index ready ({len(vector_index)} resumes)")
+
+            # Contiguous float32 file backing the zero-copy screening path
+            from src.vector_store import VectorStore
+            vector_store = VectorStore(embedding_generator.get_embedding_dimension())
+            print(f"✓ Vector store ready ({len(vector_store)} vectors)")
+
+    def refresh_vector_index():
+        """
+        Pull resumes missing from the in-memory ANN index out of the
+        database.
+
+        Uploads do not touch the index: under several workers each
+        process held a diverging copy, and a resume uploaded through
+        one worker was invisible to the others' shortlists. The
+        database is the single source of truth, so each worker tops up
+        its own index right before trusting a shortlist search. The
+        counter comparison keeps the already-in-sync case at one
+        indexed row read; the scan itself only adds unindexed ids.
+        """
+        if vector_index is None:
+            return
+        if db.get_stats()['total_resumes'] == len(vector_index):
+            return
+        for batch in db.iter_resume_embeddings():
+            for resume in batch:
+                if resume.get('embedding'):
+                    vector_index.add(
+                        resume['resume_id'],
+                        embedding_generator.deserialize_embedding(resume['embedding'])
+                    )
+
+    # Queue of (text, future) pairs drained by the background worker
+    embedding_queue = queue.Queue()
+    EMBEDDING_BATCH_SIZE = 32
+
+    def _embedding_worker():
+        """
+        Background worker that coalesces queued texts into batches.
+
+        Batched encode amortizes the per-call model overhead, so
+        concurrent uploads share a single forward pass instead of
+        each paying for their own.
+        """
+        while True:
+            item = embedding_queue.get()
+            batch = [item]
+
+            # Drain whatever else is already queued into the same batch
+            while len(batch) < EMBEDDING_BATCH_SIZE:
+                try:
+                    batch.append(embedding_queue.get(timeout=0.01))
+                except queue.Empty:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = embedding_generator.generate_embeddings(
+                    texts, batch_size=EMBEDDING_BATCH_SIZE
+                )
+                for (_, future), embedding in zip(batch, embeddings):
+                    future.set_result(embedding)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def submit_embedding(text):
+        """Queue a text for embedding and return a Future with the vector."""
+        future = Future()
+        embedding_queue.put((text, future))
+        return future
+
+    # Warm the model in the background so the first real request doesn't
+    # pay the load latency; /api/health stays responsive meanwhile
+    threading.Thread(
+        target=init_embeddings,
+        daemon=True,
+        name='model-preload'
+    ).start()
     
+    @lru_cache(maxsize=1024)
+    def get_or_compute_embedding(text):
+        """
+        Return the serialized embedding for a text, caching by content.
+
+        Checks the in-process LRU tier (via the decorator) and the
+        persistent embedding_cache table keyed by SHA-256 of the text
+        before invoking the transformer, so re-uploads of identical
+        resumes or job descriptions skip the model entirely.
+        """
+        text_hash = hashlib.sha256(text.encode('utf-8')).digest()
+
+        cached = db.get_cached_embedding(text_hash)
+        if cached is not None:
+            return cached
+
+        embedding = submit_embedding(text).result(timeout=30)
+        serialized = embedding_generator.serialize_embedding(embedding)
+        db.insert_cached_embedding(text_hash, serialized)
+
+        return serialized
+
+    # Job record with its embedding already deserialized
+    JobCacheEntry = namedtuple('JobCacheEntry', ['job', 'embedding', 'skill_bits'])
+
+    @lru_cache(maxsize=256)
+    def get_job_cached(job_id):
+        """
+        Fetch a job with its embedding deserialized, cached per job_id.
+
+        Repeat screens of the same job skip the database fetch and the
+        blob decode; upload_job clears the cache when a job is rewritten.
+        """
+        job = db.get_job_description(job_id)
+        if job is None:
+            return None
+
+        return JobCacheEntry(
+            job=job,
+            embedding=embedding_generator.deserialize_embedding(job.get('embedding')),
+            skill_bits=job.get('required_skills_bits')
+        )
+
     # Routes
     @app.route('/')
     def index():
@@ -104,9 +306,32 @@ try:
                     'error': 'Resume content is required'
                 }), 400
             
-            resume_id = data.get('resume_id') or str(__import__('uuid').uuid4())
             content = data['content']
-            
+
+            # Truly duplicate content: reuse the already-processed record
+            # instead of re-running preprocessing and the model
+            if not data.get('resume_id'):
+                existing = db.find_resume_by_content_hash(
+                    hashlib.sha256(content.encode('utf-8')).hexdigest()
+                )
+                if existing:
+                    extracted_skills = existing.get('extracted_skills')
+                    if isinstance(extracted_skills, str):
+                        extracted_skills = json_loads(extracted_skills)
+
+                    return jsonify({
+                        'success': True,
+                        'data': {
+                            'resume_id': existing['resume_id'],
+                            'candidate_name': existing['candidate_name'],
+                            'skills_extracted': len(extracted_skills or []),
+                            'experience_years': existing.get('experience_years', 0),
+                            'skills': extracted_skills
+                        }
+                    })
+
+            resume_id = data.get('resume_id') or uuid4().hex
+
             # Extract contact info
             contact_info = preprocessor.extract_contact_info(content)
             
@@ -119,9 +344,16 @@ try:
             # Extract experience
             experience_years = preprocessor.extract_years_of_experience(content)
             
-            # Generate embedding
-            embedding = embedding_generator.generate_embedding(clean_text)
-            
+            # Generate embedding (cached by content hash)
+            serialized_embedding = get_or_compute_embedding(clean_text)
+            embedding_vector = embedding_generator.deserialize_embedding(
+                serialized_embedding
+            )
+
+            # Append to the contiguous store; the row offset goes into
+            # SQLite so screening can gather vectors straight from mmap
+            embedding_offset = vector_store.append(embedding_vector)
+
             # Save to database
             resume_data = {
                 'resume_id': resume_id,
@@ -131,12 +363,18 @@ try:
                 'content': content,
                 'extracted_skills': extracted_skills,
                 'clean_text': clean_text,
-                'embedding': embedding_generator.serialize_embedding(embedding),
+                'embedding': serialized_embedding,
+                'embedding_offset': embedding_offset,
                 'experience_years': experience_years
             }
-            
+
             db.insert_resume(resume_data)
-            
+
+            # The ANN index is deliberately not updated here: it is
+            # per-process state, and mutating plus persisting it on
+            # every upload made workers diverge and overwrite each
+            # other's index files. Screening refreshes it on demand.
+
             return jsonify({
                 'success': True,
                 'data': {
@@ -170,8 +408,29 @@ try:
                     'error': 'Job description is required'
                 }), 400
             
-            job_id = data.get('job_id') or str(__import__('uuid').uuid4())
             description = data['description']
+
+            # Truly duplicate description: reuse the existing record
+            if not data.get('job_id'):
+                existing = db.find_job_by_content_hash(
+                    hashlib.sha256(description.encode('utf-8')).hexdigest()
+                )
+                if existing:
+                    required_skills = existing.get('required_skills')
+                    if isinstance(required_skills, str):
+                        required_skills = json_loads(required_skills)
+
+                    return jsonify({
+                        'success': True,
+                        'data': {
+                            'job_id': existing['job_id'],
+                            'title': existing['title'],
+                            'skills_required': len(required_skills or []),
+                            'skills': required_skills
+                        }
+                    })
+
+            job_id = data.get('job_id') or uuid4().hex
             title = data.get('title', 'Untitled Position')
             
             # Clean text
@@ -180,9 +439,9 @@ try:
             # Extract required skills
             required_skills = skill_extractor.extract_from_text(description)
             
-            # Generate embedding
-            embedding = embedding_generator.generate_embedding(clean_text)
-            
+            # Generate embedding (cached by content hash)
+            serialized_embedding = get_or_compute_embedding(clean_text)
+
             # Save to database
             job_data = {
                 'job_id': job_id,
@@ -190,11 +449,14 @@ try:
                 'description': description,
                 'required_skills': required_skills,
                 'clean_text': clean_text,
-                'embedding': embedding_generator.serialize_embedding(embedding)
+                'embedding': serialized_embedding
             }
             
             db.insert_job_description(job_data)
-            
+
+            # Drop any cached copy of a job that was just rewritten
+            get_job_cached.cache_clear()
+
             return jsonify({
                 'success': True,
                 'data': {
@@ -218,14 +480,14 @@ try:
         try:
             init_components()
             
-            # Get all jobs from database
-            jobs = db.get_all_jobs()
+            # Narrow projection: listing never needs the embeddings
+            jobs = db.list_jobs_meta()
             
             # Parse JSON fields for each job
             for job in jobs:
                 if job.get('required_skills'):
                     try:
-                        job['required_skills'] = json.loads(job['required_skills'])
+                        job['required_skills'] = json_loads(job['required_skills'])
                     except:
                         pass
             
@@ -256,52 +518,113 @@ try:
                     'error': 'job_id is required'
                 }), 400
             
-            # Get job description
-            job_data = db.get_job_description(job_id)
-            if not job_data:
+            # Get job description (embedding pre-deserialized and cached)
+            job_entry = get_job_cached(job_id)
+            if not job_entry:
                 return jsonify({
                     'success': False,
                     'error': f'Job {job_id} not found'
                 }), 404
-            
-            # Get all resumes
-            resumes = db.get_all_resumes()
-            
+
+            job_data = job_entry.job
+            job_embedding = job_entry.embedding
+            job_skill_bits = job_entry.skill_bits
+
+            # With an explicit top_k, shortlist candidates through the ANN
+            # index instead of scanning every resume; sync the index
+            # with the database first so resumes uploaded through other
+            # workers are never silently excluded
+            top_k = data.get('top_k')
+            if top_k:
+                refresh_vector_index()
+            if top_k and vector_index is not None and len(vector_index):
+                candidate_ids = [
+                    rid for rid, _ in vector_index.search(job_embedding, int(top_k))
+                ]
+                resumes = [db.get_resume(rid) for rid in candidate_ids]
+                resumes = [r for r in resumes if r]
+            else:
+                resumes = db.get_all_resumes()
+
             if not resumes:
                 return jsonify({
                     'success': False,
                     'error': 'No resumes found to screen'
                 }), 404
             
-            # Screen candidates
-            job_embedding = embedding_generator.deserialize_embedding(job_data.get('embedding'))
-            job_skills = job_data.get('required_skills')
-            if isinstance(job_skills, str):
-                job_skills = json.loads(job_skills)
-            
-            results = []
-            for resume in resumes:
-                resume_embedding = embedding_generator.deserialize_embedding(resume.get('embedding'))
-                resume_skills = resume.get('extracted_skills')
-                if isinstance(resume_skills, str):
-                    resume_skills = json.loads(resume_skills)
-                
-                resume_scoring_data = {
-                    'extracted_skills': resume_skills,
-                    'experience_years': resume.get('experience_years', 0)
-                }
-                
-                job_scoring_data = {
-                    'required_skills': job_skills
-                }
-                
-                scoring = scorer.score_candidate(
-                    resume_scoring_data,
-                    job_scoring_data,
-                    resume_embedding,
-                    job_embedding
+            # Gather all resume embeddings into one (N, D) matrix and
+            # compute every semantic similarity in a single matrix-vector
+            # product instead of N scalar dot products. When every row has
+            # an offset into the contiguous store, slice the memmap with
+            # one fancy-index op; otherwise fall back to decoding blobs.
+            offsets = [resume.get('embedding_offset') for resume in resumes]
+            if (vector_store is not None
+                    and all(o is not None for o in offsets)
+                    and (not offsets or max(offsets) < len(vector_store))):
+                resume_matrix = np.asarray(
+                    vector_store.load_all()[offsets], dtype=np.float32
+                )
+            else:
+                resume_matrix = embedding_generator.deserialize_embedding_batch(
+                    [resume.get('embedding') for resume in resumes]
                 )
-                
+            norms = np.linalg.norm(resume_matrix, axis=1, keepdims=True)
+            resume_matrix = resume_matrix / np.where(norms == 0, 1, norms)
+
+            job_norm = np.linalg.norm(job_embedding)
+            job_vector = job_embedding / (job_norm if job_norm else 1)
+
+            similarities = resume_matrix @ job_vector
+
+            # Zero embeddings (e.g. whitespace-only content) have no
+            # defined cosine; flag them NaN so the batch scorer gives
+            # them semantic 0.0 like calculate_semantic_similarity,
+            # instead of the 0.5 that (0 + 1) / 2 would award
+            if not job_norm:
+                similarities[:] = np.nan
+            else:
+                zero_rows = ~resume_matrix.any(axis=1)
+                if zero_rows.any():
+                    similarities[zero_rows] = np.nan
+
+            # Structure-of-arrays view of the candidate pool. Prefer the
+            # bitmask columns written at insert time: they let the skill
+            # component run without any JSON parsing in the hot path.
+            resume_skill_bits = [r.get('extracted_skills_bits') for r in resumes]
+            use_bits = (job_skill_bits is not None
+                        and all(b is not None for b in resume_skill_bits))
+
+            if use_bits:
+                resume_skill_lists = None
+                job_skills = None
+            else:
+                job_skills = job_data.get('required_skills')
+                if isinstance(job_skills, str):
+                    job_skills = json_loads(job_skills)
+
+                resume_skill_lists = []
+                for resume in resumes:
+                    resume_skills = resume.get('extracted_skills')
+                    if isinstance(resume_skills, str):
+                        resume_skills = json_loads(resume_skills)
+                    resume_skill_lists.append(resume_skills or [])
+
+            experience_years = np.array(
+                [resume.get('experience_years') or 0 for resume in resumes],
+                dtype=np.float32
+            )
+
+            scorings = scorer.score_candidates_batch(
+                resume_skill_lists,
+                experience_years,
+                similarities,
+                job_skills,
+                resume_skill_bits=resume_skill_bits if use_bits else None,
+                job_skill_bits=job_skill_bits if use_bits else None
+            )
+
+            results = []
+            for resume, scoring in zip(resumes, scorings):
                 result = {
                     'job_id': job_data['job_id'],
                     'resume_id': resume['resume_id'],
@@ -312,26 +635,34 @@ try:
                     'matched_skills': scoring.matched_skills,
                     'rank': 0
                 }
-                
+
                 results.append(result)
             
             # Rank candidates
             results = scorer.rank_candidates(results)
             
-            # Save results
-            db.clear_screening_results(job_id)
-            for result in results:
-                db.insert_screening_result(result)
-            
-            return jsonify({
-                'success': True,
-                'data': {
-                    'job_id': job_id,
-                    'candidates_screened': len(results),
-                    'results': results
-                }
-            })
-            
+            # Save results (clear + insert in one transaction)
+            db.insert_screening_results_batch(job_id, results)
+
+            # Stream the payload one candidate at a time so large result
+            # sets never materialize as a single giant string
+            def generate_response(results=results, job_id=job_id):
+                yield (b'{"success": true, "data": {"job_id": ' +
+                       json_dumps_bytes(job_id) +
+                       b', "candidates_screened": ' +
+                       str(len(results)).encode() +
+                       b', "results": [')
+                for i, result in enumerate(results):
+                    if i:
+                        yield b','
+                    yield json_dumps_bytes(result)
+                yield b']}}'
+
+            return Response(
+                stream_with_context(generate_response()),
+                mimetype='application/json'
+            )
+
         except Exception as e:
             print(f"Error: {e}")
             import traceback
@@ -346,13 +677,14 @@ try:
         """Get screening results for a job."""
         try:
             init_components()
-            results = db.get_screening_results(job_id)
+            limit = request.args.get('limit', type=int)
+            results = db.get_screening_results(job_id, limit=limit)
             
             # Parse JSON fields
             for result in results:
                 if result.get('matched_skills'):
                     try:
-                        result['matched_skills'] = json.loads(result['matched_skills'])
+                        result['matched_skills'] = json_loads(result['matched_skills'])
                     except:
                         pass
             
@@ -371,15 +703,17 @@ try:
                 'error': str(e)
             }), 500
     
-    # Run the app
-    print("\n" + "="*60)
-    print("Resume Screener API Starting")
-    print("="*60)
-    print(f"Server: http://localhost:5000")
-    print(f"API Docs: http://localhost:5000 (Web Interface)")
-    print("="*60 + "\n")
-    
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    # Run the development server only when invoked directly; production
+    # deployments should go through wsgi.py under gunicorn/waitress
+    if __name__ == '__main__':
+        print("\n" + "="*60)
+        print("Resume Screener API Starting")
+        print("="*60)
+        print(f"Server: http://localhost:5000")
+        print(f"API Docs: http://localhost:5000 (Web Interface)")
+        print("="*60 + "\n")
+
+        app.run(host='0.0.0.0', port=5000, debug=False)
 
 except KeyboardInterrupt:
     print("\n\nShutting down...")
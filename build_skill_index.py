@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Build the prebuilt skill-matcher index for the default vocabulary.
+
+Constructing the Aho-Corasick tries over SKILL_KEYWORDS is pure
+startup work that never changes between deploys, so this script does
+it once at build time and pickles the result to SKILL_INDEX_PATH.
+Extractors load the pickled automatons when the stored keyword list
+still matches config.SKILL_KEYWORDS and fall back to building them
+in-process otherwise, so a stale index is never silently used.
+
+Rerun after editing SKILL_KEYWORDS. Usage: python build_skill_index.py
+"""
+
+import pickle
+
+import config
+from src.skill_extraction import (
+    AHOCORASICK_AVAILABLE,
+    SKILL_INDEX_FORMAT,
+    _DEFAULT_KEYWORDS,
+    _build_scan_automaton,
+    _build_skill_automaton,
+)
+
+
+def main():
+    """Build and pickle the default-vocabulary automatons."""
+    print("="*60)
+    print(f"Building skill index at {config.SKILL_INDEX_PATH}")
+    print("="*60)
+
+    if not AHOCORASICK_AVAILABLE:
+        print("Warning: pyahocorasick not available. Nothing to prebuild; "
+              "extractors will use the regex fallback.")
+        return
+
+    payload = {
+        'format': SKILL_INDEX_FORMAT,
+        'keywords': sorted(_DEFAULT_KEYWORDS),
+        'skill_automaton': _build_skill_automaton(_DEFAULT_KEYWORDS),
+        'scan_automaton': _build_scan_automaton(_DEFAULT_KEYWORDS),
+    }
+
+    config.SKILL_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(config.SKILL_INDEX_PATH, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    print(f"✓ Indexed {len(payload['keywords'])} skills")
+    print(f"✓ Skill index written to {config.SKILL_INDEX_PATH}")
+
+
+if __name__ == '__main__':
+    main()
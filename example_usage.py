@@ -4,12 +4,20 @@ Example script demonstrating how to use the Resume Screening System.
 
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from typing import List, Dict
 
 
 # API base URL
 BASE_URL = "http://localhost:5000/api"
 
+# Shared session so every call reuses pooled TCP connections instead of
+# paying a fresh handshake per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+
 
 def upload_sample_resumes() -> List[str]:
     """Upload sample resumes and return their IDs."""
@@ -119,15 +127,26 @@ def upload_sample_resumes() -> List[str]:
     print("Uploading sample resumes...")
     resume_ids = []
     
-    for resume in sample_resumes:
-        response = requests.post(f"{BASE_URL}/upload/resume", json=resume)
-        if response.status_code == 200:
-            data = response.json()
-            resume_id = data['data']['resume_id']
-            resume_ids.append(resume_id)
-            print(f"✓ Uploaded: {resume['candidate_name']} (ID: {resume_id})")
-        else:
-            print(f"✗ Failed to upload: {resume['candidate_name']}")
+    def upload_one(resume: Dict) -> str:
+        response = SESSION.post(f"{BASE_URL}/upload/resume", json=resume)
+        response.raise_for_status()
+        return response.json()['data']['resume_id']
+    
+    # Fan uploads out over a thread pool; the session above keeps the
+    # parallel requests on pooled connections
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(upload_one, resume): resume
+            for resume in sample_resumes
+        }
+        for future in as_completed(futures):
+            resume = futures[future]
+            try:
+                resume_id = future.result()
+                resume_ids.append(resume_id)
+                print(f"✓ Uploaded: {resume['candidate_name']} (ID: {resume_id})")
+            except Exception as e:
+                print(f"✗ Failed to upload: {resume['candidate_name']} ({e})")
     
     return resume_ids
 
@@ -170,7 +189,7 @@ def upload_sample_job() -> str:
     }
     
     print("\nUploading job description...")
-    response = requests.post(f"{BASE_URL}/upload/job", json=job_description)
+    response = SESSION.post(f"{BASE_URL}/upload/job", json=job_description)
     
     if response.status_code == 200:
         data = response.json()
@@ -191,7 +210,7 @@ def screen_candidates(job_id: str, resume_ids: List[str] = None):
     if resume_ids:
         payload["resume_ids"] = resume_ids
     
-    response = requests.post(f"{BASE_URL}/screen", json=payload)
+    response = SESSION.post(f"{BASE_URL}/screen", json=payload)
     
     if response.status_code == 200:
         data = response.json()
@@ -206,7 +225,7 @@ def display_results(job_id: str):
     """Display screening results."""
     
     print(f"\nFetching results for job {job_id}...")
-    response = requests.get(f"{BASE_URL}/results/{job_id}")
+    response = SESSION.get(f"{BASE_URL}/results/{job_id}")
     
     if response.status_code != 200:
         print(f"✗ Failed to fetch results")
@@ -242,7 +261,7 @@ def display_results(job_id: str):
 def check_api_health():
     """Check if API is running."""
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=2)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=2)
         return response.status_code == 200
     except:
         return False
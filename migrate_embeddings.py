@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+One-shot migration: rewrite legacy pickled embedding BLOBs in raw format.
+
+Older databases stored embeddings as pickled float64 numpy arrays. The
+current format is a tagged raw buffer (EMB1 float16 / EMB8 int8) that is
+half the size or smaller and avoids unpickling untrusted bytes on read.
+New code reads both formats, so this script only needs to run once per
+database; rows already in the raw format are left untouched.
+
+Usage: python migrate_embeddings.py [db_path]
+"""
+
+import sys
+
+import config
+from src.database import Database
+from src.embeddings import (
+    EMBEDDING_BLOB_MAGIC,
+    EMBEDDING_BLOB_MAGIC_INT8,
+    EmbeddingGenerator,
+)
+
+# Columns holding embedding BLOBs, per table, with the key to update by
+EMBEDDING_COLUMNS = [
+    ('resumes', 'embedding', 'resume_id'),
+    ('job_descriptions', 'embedding', 'job_id'),
+    ('embedding_cache', 'vec', 'hash'),
+]
+
+
+def migrate_table(conn, table, column, key_column):
+    """
+    Re-serialize legacy embedding blobs in one table.
+
+    Args:
+        conn: Open database connection
+        table: Table name holding the embedding column
+        column: Name of the BLOB column
+        key_column: Primary-key column used for the UPDATE
+
+    Returns:
+        Tuple of (rows migrated, rows already in raw format)
+    """
+    # Serializer/deserializer are static-style methods that don't touch
+    # the model, so skip loading sentence-transformers for a migration
+    generator = EmbeddingGenerator.__new__(EmbeddingGenerator)
+
+    cursor = conn.cursor()
+    cursor.execute(f'SELECT {key_column}, {column} FROM {table} WHERE {column} IS NOT NULL')
+
+    migrated = 0
+    skipped = 0
+    updates = []
+    for row in cursor.fetchall():
+        blob = row[column]
+        if blob[:4] in (EMBEDDING_BLOB_MAGIC, EMBEDDING_BLOB_MAGIC_INT8):
+            skipped += 1
+            continue
+        vector = generator.deserialize_embedding(blob)
+        updates.append((generator.serialize_embedding(vector), row[key_column]))
+        migrated += 1
+
+    if updates:
+        cursor.executemany(
+            f'UPDATE {table} SET {column} = ? WHERE {key_column} = ?',
+            updates
+        )
+        conn.commit()
+
+    return migrated, skipped
+
+
+def main():
+    """Migrate every embedding column in the database."""
+    db_path = sys.argv[1] if len(sys.argv) > 1 else config.DATABASE_PATH
+
+    print("="*60)
+    print(f"Migrating embeddings in {db_path}")
+    print("="*60)
+
+    db = Database(db_path)
+    conn = db.get_connection()
+
+    try:
+        for table, column, key_column in EMBEDDING_COLUMNS:
+            migrated, skipped = migrate_table(conn, table, column, key_column)
+            print(f"✓ {table}.{column}: {migrated} migrated, {skipped} already raw")
+    finally:
+        conn.close()
+
+    # Reclaim the space freed by shrinking the BLOBs
+    db.get_connection().execute('VACUUM')
+    print("✓ Migration complete")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,14 @@ Flask REST API for Resume Screening System.
 Provides endpoints for uploading resumes, job descriptions, and retrieving screening results.
 """
 
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, jsonify, render_template, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 from typing import Dict, List
 import json
-import uuid
+import secrets
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 
@@ -18,10 +21,108 @@ from src.scoring import CandidateScorer
 from src.database import Database
 import config
 
+# orjson parses and serializes several times faster than stdlib json;
+# fall back transparently when it isn't installed
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+
+    def ojsonify(obj):
+        """jsonify replacement that serializes through orjson."""
+        return Response(
+            orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+            mimetype='application/json'
+        )
+except Exception:
+    orjson = None
+    json_loads = json.loads
+    ojsonify = jsonify
+
+    def json_dumps_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+
+
+def stream_results_response(meta: Dict, results: List[Dict]) -> Response:
+    """
+    Stream a success payload one result at a time.
+
+    Large screenings serialize to multi-megabyte JSON; yielding per
+    candidate keeps peak memory flat and gets first bytes to the client
+    immediately.
+
+    Args:
+        meta: Leading fields of the data object (e.g. job_id, counts)
+        results: Result dictionaries for the "results" array
+
+    Returns:
+        Chunked JSON response
+    """
+    # json_dumps_bytes(meta) is b'{...}'; splice the results array in
+    # before its closing brace
+    prefix = (b'{"success": true, "data": '
+              + json_dumps_bytes(meta)[:-1]
+              + b', "results": [')
+
+    def generate():
+        yield prefix
+        for i, result in enumerate(results):
+            if i:
+                yield b','
+            yield json_dumps_bytes(result)
+        yield b']}}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+# Shared components, created once per process. Loading them at module
+# scope (rather than per ResumeScreenerAPI instance) means Flask's debug
+# reloader and create_app() don't pay the multi-second SentenceTransformer
+# load twice, and under `gunicorn --preload` the model weights are loaded
+# once in the master and shared copy-on-write across forked workers.
+_preprocessor = None
+_skill_extractor = None
+_embedding_generator = None
+_scorer = None
+_db = None
+_components_initialized = False
+
+
+def _init_components():
+    """Initialize the shared components exactly once per process."""
+    global _preprocessor, _skill_extractor, _embedding_generator
+    global _scorer, _db, _components_initialized
+
+    if _components_initialized:
+        return
+
+    print("Initializing Resume Screener API...")
+    _preprocessor = TextPreprocessor(use_spacy=False)
+    _skill_extractor = SkillExtractor(use_spacy=False)
+    _embedding_generator = EmbeddingGenerator()
+    _scorer = CandidateScorer()
+    _db = Database()
+
+    # Warm up the encoder across representative token lengths so the
+    # first user-visible request doesn't pay one-time BLAS kernel
+    # selection and tokenizer cache population
+    start = time.time()
+    _embedding_generator.generate_embeddings(
+        ["warmup " * n for n in (8, 64, 256)]
+    )
+    print(f"✓ Embedding warmup completed in {time.time() - start:.2f}s")
+
+    _components_initialized = True
+
 
 class ResumeScreenerAPI:
     """Flask API wrapper for resume screening system."""
-    
+
+    # Upper bound on the deserialized-embedding cache (ndarrays are
+    # ~1.5KB each for MiniLM, so the cap costs a few MB at most)
+    EMBEDDING_CACHE_SIZE = 4096
+
     def __init__(self):
         """Initialize the API with all required components."""
         # Set template and static folders
@@ -33,14 +134,32 @@ class ResumeScreenerAPI:
                         static_folder=static_dir)
         CORS(self.app)
         
-        # Initialize components
-        print("Initializing Resume Screener API...")
-        self.preprocessor = TextPreprocessor(use_spacy=False)
-        self.skill_extractor = SkillExtractor(use_spacy=False)
-        self.embedding_generator = EmbeddingGenerator()
-        self.scorer = CandidateScorer()
-        self.db = Database()
-        
+        # Bind the process-wide singletons (created on first use)
+        _init_components()
+        self.preprocessor = _preprocessor
+        self.skill_extractor = _skill_extractor
+        self.embedding_generator = _embedding_generator
+        self.scorer = _scorer
+        self.db = _db
+
+        # resume_id -> deserialized embedding ndarray, so repeat screens
+        # skip the per-row blob decode entirely
+        self._embedding_cache = {}
+
+        # Response-ready rows for the GET endpoints (JSON fields already
+        # parsed, blobs stripped); entries are dropped when the record
+        # is re-uploaded
+        self._resume_row_cache = {}
+        self._job_row_cache = {}
+
+        # Shared pool for scoring resume batches: the NumPy/BLAS matrix
+        # work releases the GIL, so batches genuinely overlap
+        self._screen_executor = ThreadPoolExecutor(
+            max_workers=max(1, os.cpu_count() or 1),
+            thread_name_prefix='screen'
+        )
+
+
         # Register routes
         self._register_routes()
         print("API initialized successfully!")
@@ -53,14 +172,20 @@ class ResumeScreenerAPI:
             """Serve the frontend."""
             return render_template('index.html')
         
+        # Everything in the health payload except the timestamp is
+        # constant, so build the response bytes around a cached template
+        # and skip jsonify entirely on this high-QPS endpoint
+        health_template = (
+            '{"status": "healthy", "timestamp": %.6f, "version": "1.0.0"}'
+        )
+
         @self.app.route('/api/health', methods=['GET'])
         def health_check():
             """Health check endpoint."""
-            return jsonify({
-                'status': 'healthy',
-                'timestamp': datetime.now().isoformat(),
-                'version': '1.0.0'
-            })
+            return Response(
+                health_template % time.time(),
+                mimetype='application/json'
+            )
         
         @self.app.route('/api/stats', methods=['GET'])
         def get_stats():
@@ -102,7 +227,7 @@ class ResumeScreenerAPI:
                     }), 400
                 
                 # Generate resume ID if not provided
-                resume_id = data.get('resume_id') or str(uuid.uuid4())
+                resume_id = data.get('resume_id') or secrets.token_hex(16)
                 
                 # Process resume
                 result = self._process_resume(data, resume_id)
@@ -141,10 +266,27 @@ class ResumeScreenerAPI:
                         'error': 'No resumes provided'
                     }), 400
                 
+                # Two passes: preprocess everything first, then encode all
+                # clean texts in one batched model call so the transformer
+                # runs one wide forward pass instead of one per resume
+                resume_ids = [
+                    resume_data.get('resume_id') or secrets.token_hex(16)
+                    for resume_data in resumes
+                ]
+                clean_texts = self.preprocessor.preprocess_batch(
+                    [resume_data['content'] for resume_data in resumes],
+                    remove_stops=False
+                )
+                embeddings = self.embedding_generator.generate_embeddings(clean_texts)
+
                 results = []
-                for resume_data in resumes:
-                    resume_id = resume_data.get('resume_id') or str(uuid.uuid4())
-                    result = self._process_resume(resume_data, resume_id)
+                for resume_data, resume_id, clean_text, embedding in zip(
+                        resumes, resume_ids, clean_texts, embeddings):
+                    result = self._process_resume(
+                        resume_data, resume_id,
+                        clean_text=clean_text,
+                        embedding=embedding
+                    )
                     results.append(result)
                 
                 return jsonify({
@@ -184,7 +326,7 @@ class ResumeScreenerAPI:
                     }), 400
                 
                 # Generate job ID if not provided
-                job_id = data.get('job_id') or str(uuid.uuid4())
+                job_id = data.get('job_id') or secrets.token_hex(16)
                 
                 # Process job description
                 result = self._process_job(data, job_id)
@@ -208,7 +350,8 @@ class ResumeScreenerAPI:
             Expected JSON:
             {
                 "job_id": "job123",
-                "resume_ids": ["resume1", "resume2", ...] (optional - if not provided, screen all)
+                "resume_ids": ["resume1", "resume2", ...] (optional - if not provided, screen all),
+                "top_k": 100 (optional - return only the K best; all scores are still persisted)
             }
             """
             try:
@@ -229,36 +372,43 @@ class ResumeScreenerAPI:
                         'error': f'Job {job_id} not found'
                     }), 404
                 
-                # Get resumes to screen
+                # Get resumes to screen. With an explicit id list, fetch
+                # those rows; otherwise stream the whole pool from the
+                # database in fixed-size batches so screening never holds
+                # every full row (content included) in memory at once.
                 resume_ids = data.get('resume_ids')
                 if resume_ids:
-                    resumes = [self.db.get_resume(rid) for rid in resume_ids]
-                    resumes = [r for r in resumes if r]  # Filter out None values
+                    # One IN query instead of a round-trip per id
+                    resumes = self.db.get_resumes_by_ids(resume_ids)
+                    resume_batches = [resumes] if resumes else []
                 else:
-                    resumes = self.db.get_all_resumes()
-                
-                if not resumes:
+                    resume_batches = self.db.iter_resume_embeddings()
+
+                # Perform screening
+                results = self._screen_candidates(job_data, resume_batches)
+
+                if not results:
                     return jsonify({
                         'success': False,
                         'error': 'No resumes found to screen'
                     }), 404
                 
-                # Perform screening
-                results = self._screen_candidates(job_data, resumes)
-                
-                # Clear previous results and save new ones
-                self.db.clear_screening_results(job_id)
-                for result in results:
-                    self.db.insert_screening_result(result)
-                
-                return jsonify({
-                    'success': True,
-                    'data': {
-                        'job_id': job_id,
-                        'candidates_screened': len(results),
-                        'results': results
-                    }
-                })
+                # Clear previous results and save the new batch in one
+                # transaction (single commit instead of one per row)
+                self.db.insert_screening_results_batch(job_id, results)
+
+                candidates_screened = len(results)
+
+                # Results arrive ranked, so top-K is a slice; every score
+                # was already persisted above for later /api/results pages
+                top_k = data.get('top_k')
+                if top_k:
+                    results = results[:max(0, int(top_k))]
+
+                return stream_results_response(
+                    {'job_id': job_id, 'candidates_screened': candidates_screened},
+                    results
+                )
                 
             except Exception as e:
                 return jsonify({
@@ -270,24 +420,21 @@ class ResumeScreenerAPI:
         def get_results(job_id):
             """Get screening results for a job."""
             try:
-                results = self.db.get_screening_results(job_id)
+                limit = request.args.get('limit', type=int)
+                results = self.db.get_screening_results(job_id, limit=limit)
                 
                 # Parse JSON fields
                 for result in results:
                     if result.get('matched_skills'):
                         try:
-                            result['matched_skills'] = json.loads(result['matched_skills'])
-                        except:
+                            result['matched_skills'] = json_loads(result['matched_skills'])
+                        except Exception:
                             pass
                 
-                return jsonify({
-                    'success': True,
-                    'data': {
-                        'job_id': job_id,
-                        'total_candidates': len(results),
-                        'results': results
-                    }
-                })
+                return stream_results_response(
+                    {'job_id': job_id, 'total_candidates': len(results)},
+                    results
+                )
                 
             except Exception as e:
                 return jsonify({
@@ -299,29 +446,30 @@ class ResumeScreenerAPI:
         def get_resume(resume_id):
             """Get resume details."""
             try:
-                resume = self.db.get_resume(resume_id)
-                
+                resume = self._cached_resume(resume_id)
+
                 if not resume:
                     return jsonify({
                         'success': False,
                         'error': 'Resume not found'
                     }), 404
-                
-                # Parse JSON fields
-                if resume.get('extracted_skills'):
-                    try:
-                        resume['extracted_skills'] = json.loads(resume['extracted_skills'])
-                    except:
-                        pass
-                
-                # Don't include large fields
-                resume.pop('embedding', None)
-                
-                return jsonify({
+
+                # Re-uploads update the row in place and keep its
+                # created_at, so the ETag hangs off the content hash:
+                # it changes exactly when the stored resume does (the
+                # timestamp fallback covers pre-hash legacy rows)
+                etag = (f"{resume_id}:"
+                        f"{resume.get('content_sha256') or resume.get('created_at', '')}")
+                if request.if_none_match.contains(etag):
+                    return Response(status=304)
+
+                response = ojsonify({
                     'success': True,
                     'data': resume
                 })
-                
+                response.set_etag(etag)
+                return response
+
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -332,26 +480,26 @@ class ResumeScreenerAPI:
         def get_job(job_id):
             """Get job description details."""
             try:
-                job = self.db.get_job_description(job_id)
-                
+                job = self._cached_job(job_id)
+
                 if not job:
                     return jsonify({
                         'success': False,
                         'error': 'Job not found'
                     }), 404
-                
-                # Parse JSON fields
-                if job.get('required_skills'):
-                    try:
-                        job['required_skills'] = json.loads(job['required_skills'])
-                    except:
-                        pass  # Keep as string if parsing fails
-                
-                return jsonify({
+
+                etag = (f"{job_id}:"
+                        f"{job.get('description_sha256') or job.get('created_at', '')}")
+                if request.if_none_match.contains(etag):
+                    return Response(status=304)
+
+                response = ojsonify({
                     'success': True,
                     'data': job
                 })
-                
+                response.set_etag(etag)
+                return response
+
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -362,18 +510,18 @@ class ResumeScreenerAPI:
         def list_jobs():
             """List all job descriptions."""
             try:
-                # Get all jobs from database
-                jobs = self.db.get_all_jobs()
+                # Narrow projection: listing never needs the embeddings
+                jobs = self.db.list_jobs_meta()
                 
                 # Parse JSON fields for each job
                 for job in jobs:
                     if job.get('required_skills'):
                         try:
-                            job['required_skills'] = json.loads(job['required_skills'])
-                        except:
+                            job['required_skills'] = json_loads(job['required_skills'])
+                        except Exception:
                             pass
                 
-                return jsonify({
+                return ojsonify({
                     'success': True,
                     'data': jobs
                 })
@@ -383,24 +531,121 @@ class ResumeScreenerAPI:
                     'error': str(e)
                 }), 500
     
-    def _process_resume(self, data: Dict, resume_id: str) -> Dict:
-        """Process a resume and store in database."""
+    def _bounded_cache_put(self, cache: Dict, key, value,
+                           cap: int = EMBEDDING_CACHE_SIZE):
+        """Insert into a dict cache, evicting the oldest entry at cap."""
+        if key not in cache and len(cache) >= cap:
+            # Dicts iterate in insertion order, so this drops the oldest
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _cached_resume(self, resume_id: str) -> Dict:
+        """
+        Get a response-ready resume row, cached per id.
+
+        The cached dict has extracted_skills parsed and the embedding
+        blob removed, so repeat GETs skip both the database fetch and
+        the JSON decode. _process_resume invalidates on re-upload.
+        """
+        cached = self._resume_row_cache.get(resume_id)
+        if cached is not None:
+            return cached
+
+        resume = self.db.get_resume(resume_id)
+        if not resume:
+            return None
+
+        if isinstance(resume.get('extracted_skills'), str):
+            try:
+                resume['extracted_skills'] = json_loads(resume['extracted_skills'])
+            except Exception:
+                pass
+        resume.pop('embedding', None)
+
+        self._bounded_cache_put(self._resume_row_cache, resume_id, resume)
+        return resume
+
+    def _cached_job(self, job_id: str) -> Dict:
+        """
+        Get a response-ready job row, cached per id.
+
+        Same contract as _cached_resume; _process_job invalidates on
+        re-upload.
+        """
+        cached = self._job_row_cache.get(job_id)
+        if cached is not None:
+            return cached
+
+        job = self.db.get_job_description(job_id)
+        if not job:
+            return None
+
+        if isinstance(job.get('required_skills'), str):
+            try:
+                job['required_skills'] = json_loads(job['required_skills'])
+            except Exception:
+                pass
+        job.pop('embedding', None)
+
+        self._bounded_cache_put(self._job_row_cache, job_id, job)
+        return job
+
+    def _cache_resume_embedding(self, resume_id: str, embedding):
+        """Remember a deserialized embedding, evicting the oldest entry."""
+        if (resume_id not in self._embedding_cache
+                and len(self._embedding_cache) >= self.EMBEDDING_CACHE_SIZE):
+            # Dicts iterate in insertion order, so this drops the oldest
+            self._embedding_cache.pop(next(iter(self._embedding_cache)))
+        self._embedding_cache[resume_id] = embedding
+
+    def _get_resume_embedding(self, resume: Dict):
+        """
+        Get the deserialized embedding for a resume row.
+
+        Checks the in-memory cache before decoding the database blob, so
+        repeated screens over the same pool pay the marshalling cost once.
+        """
+        resume_id = resume.get('resume_id')
+        cached = self._embedding_cache.get(resume_id)
+        if cached is not None:
+            return cached
+
+        embedding = self.embedding_generator.deserialize_embedding(
+            resume.get('embedding')
+        )
+        self._cache_resume_embedding(resume_id, embedding)
+        return embedding
+
+    def _process_resume(self, data: Dict, resume_id: str,
+                        clean_text: str = None,
+                        embedding=None) -> Dict:
+        """
+        Process a resume and store in database.
+
+        Args:
+            data: Raw resume payload
+            resume_id: Identifier for the resume
+            clean_text: Preprocessed text, if already computed
+            embedding: Embedding vector, if already computed (batch path)
+        """
         content = data['content']
-        
-        # Extract contact info
-        contact_info = self.preprocessor.extract_contact_info(content)
-        
-        # Clean text
-        clean_text = self.preprocessor.preprocess(content, remove_stops=False)
-        
-        # Extract skills
-        extracted_skills = self.skill_extractor.extract_from_text(content)
-        
-        # Extract experience
-        experience_years = self.preprocessor.extract_years_of_experience(content)
-        
+
+        # One parsing pass over the raw content: the lowercased copy is
+        # shared by contact-info, experience and skill extraction instead
+        # of each step re-lowercasing the same string
+        doc = self.preprocessor.full_parse(
+            content, remove_stops=False, clean_text=clean_text
+        )
+        contact_info = doc.contact_info
+        clean_text = doc.clean_text
+        experience_years = doc.years_experience
+
+        # Extract skills (input already lowercased)
+        extracted_skills = self.skill_extractor.extract_from_text(doc.lowercase_text)
+
         # Generate embedding
-        embedding = self.embedding_generator.generate_embedding(clean_text)
+        if embedding is None:
+            embedding = self.embedding_generator.generate_embedding(clean_text)
         
         # Prepare data for database
         resume_data = {
@@ -417,7 +662,12 @@ class ResumeScreenerAPI:
         
         # Save to database
         self.db.insert_resume(resume_data)
-        
+
+        # Seed the embedding cache with the ndarray we already have in
+        # hand, and drop any stale cached row for this id
+        self._cache_resume_embedding(resume_id, embedding)
+        self._resume_row_cache.pop(resume_id, None)
+
         return {
             'resume_id': resume_id,
             'candidate_name': resume_data['candidate_name'],
@@ -452,6 +702,9 @@ class ResumeScreenerAPI:
         
         # Save to database
         self.db.insert_job_description(job_data)
+
+        # Drop any stale cached row for a re-uploaded job
+        self._job_row_cache.pop(job_id, None)
         
         return {
             'job_id': job_id,
@@ -460,49 +713,110 @@ class ResumeScreenerAPI:
             'skills': required_skills
         }
     
-    def _screen_candidates(self, job_data: Dict, resumes: List[Dict]) -> List[Dict]:
-        """Screen candidates against a job."""
+    def _screen_candidates(self, job_data: Dict, resume_batches) -> List[Dict]:
+        """
+        Screen candidates against a job.
+
+        Args:
+            job_data: Job description row
+            resume_batches: Iterable of resume-row batches, e.g. from
+                           Database.iter_resume_embeddings(); a single
+                           in-memory list can be passed as [resumes]
+
+        Returns:
+            Ranked screening result dictionaries
+        """
         # Deserialize job embedding
         job_embedding = self.embedding_generator.deserialize_embedding(
             job_data.get('embedding')
         )
-        
+
+        job_norm = np.linalg.norm(job_embedding)
+        job_vector = job_embedding / (job_norm if job_norm else 1)
+
         # Parse job skills
         job_skills = job_data.get('required_skills')
         if isinstance(job_skills, str):
-            job_skills = json.loads(job_skills)
-        
-        results = []
-        
-        for resume in resumes:
-            # Deserialize resume embedding
-            resume_embedding = self.embedding_generator.deserialize_embedding(
-                resume.get('embedding')
+            job_skills = json_loads(job_skills)
+
+        # Fan the batches out across the screening pool so DB fetch in
+        # this thread overlaps with scoring in the workers, and multiple
+        # batches' matrix products run on separate cores
+        futures = [
+            self._screen_executor.submit(
+                self._score_batch, job_data, job_skills, job_vector, resumes
             )
-            
+            for resumes in resume_batches
+        ]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+        # Rank candidates
+        results = self.scorer.rank_candidates(results)
+
+        return results
+
+    def _score_batch(self, job_data: Dict, job_skills: List[str],
+                     job_vector: np.ndarray, resumes: List[Dict]) -> List[Dict]:
+        """
+        Score one batch of resumes against a job.
+
+        Stacks the batch's embeddings (cached across screens) into a
+        row-normalized float32 matrix and computes its cosine
+        similarities with one BLAS matrix-vector product. Runs on the
+        screening thread pool.
+
+        Args:
+            job_data: Job description row
+            job_skills: Parsed required-skill list
+            job_vector: Unit-normalized job embedding
+            resumes: Batch of resume rows
+
+        Returns:
+            Unranked screening result dictionaries for the batch
+        """
+        resume_matrix = self.scorer._l2_normalize(np.vstack(
+            [self._get_resume_embedding(resume) for resume in resumes]
+        ))
+
+        similarities = resume_matrix @ job_vector
+
+        # Zero embeddings have no defined cosine; NaN makes
+        # score_candidate give them semantic 0.0 like the scalar path
+        if not job_vector.any():
+            similarities[:] = np.nan
+        else:
+            zero_rows = ~resume_matrix.any(axis=1)
+            if zero_rows.any():
+                similarities[zero_rows] = np.nan
+
+        results = []
+
+        for resume, similarity in zip(resumes, similarities):
             # Parse resume skills
             resume_skills = resume.get('extracted_skills')
             if isinstance(resume_skills, str):
-                resume_skills = json.loads(resume_skills)
-            
+                resume_skills = json_loads(resume_skills)
+
             # Prepare data for scoring
             resume_scoring_data = {
                 'extracted_skills': resume_skills,
                 'experience_years': resume.get('experience_years', 0)
             }
-            
+
             job_scoring_data = {
                 'required_skills': job_skills
             }
-            
-            # Calculate scores
+
+            # Calculate scores (semantic similarity computed above)
             scoring = self.scorer.score_candidate(
                 resume_scoring_data,
                 job_scoring_data,
-                resume_embedding,
-                job_embedding
+                semantic_similarity=float(similarity)
             )
-            
+
             # Create result
             result = {
                 'job_id': job_data['job_id'],
@@ -514,18 +828,20 @@ class ResumeScreenerAPI:
                 'matched_skills': scoring.matched_skills,
                 'rank': 0  # Will be assigned during ranking
             }
-            
+
             results.append(result)
-        
-        # Rank candidates
-        results = self.scorer.rank_candidates(results)
-        
+
         return results
     
     def run(self, host: str = None, port: int = None, debug: bool = None):
         """
         Run the Flask application.
-        
+
+        Outside debug mode this execs into gunicorn (threaded workers,
+        model preloaded in the master) instead of Flask's single-threaded
+        development server, which would serialize every request behind
+        each 20-50ms embedding call.
+
         Args:
             host: Host address
             port: Port number
@@ -534,7 +850,7 @@ class ResumeScreenerAPI:
         host = host or config.FLASK_HOST
         port = port or config.FLASK_PORT
         debug = debug if debug is not None else config.FLASK_DEBUG
-        
+
         print(f"\n{'='*60}")
         print(f"Resume Screener API Starting")
         print(f"{'='*60}")
@@ -542,12 +858,34 @@ class ResumeScreenerAPI:
         print(f"Port: {port}")
         print(f"Debug: {debug}")
         print(f"{'='*60}\n")
-        
-        self.app.run(host=host, port=port, debug=debug)
+
+        if debug:
+            self.app.run(host=host, port=port, debug=debug)
+            return
+
+        try:
+            os.execvp('gunicorn', [
+                'gunicorn',
+                '--workers', str(os.cpu_count() or 1),
+                '--threads', '4',
+                '--worker-class', 'gthread',
+                '--preload',
+                '--bind', f'{host}:{port}',
+                'src.api:create_app()'
+            ])
+        except FileNotFoundError:
+            print("Warning: gunicorn not found. Falling back to Flask dev server.")
+            self.app.run(host=host, port=port, debug=debug)
 
 
 def create_app():
-    """Factory function to create Flask app."""
+    """
+    Factory function to create Flask app.
+
+    Components are process-wide singletons, so serve this with
+    `gunicorn --preload --workers N "src.api:create_app()"` to load the
+    embedding model once in the master and fork it into each worker.
+    """
     api = ResumeScreenerAPI()
     return api.app
 
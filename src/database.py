@@ -3,14 +3,162 @@ Database models and initialization for Resume Screening System.
 Handles SQLite database setup and CRUD operations.
 """
 
+import atexit
 import sqlite3
+import threading
+import hashlib
 import json
+import queue
+import numpy as np
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import config
 
 
+def _content_hash(text) -> Optional[str]:
+    """SHA-256 hex digest of a text column, or None for empty values."""
+    if not text:
+        return None
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _skills_to_bits(skills) -> bytes:
+    """
+    Pack a skill list into a little-endian bitmask over config.SKILL_TO_BIT.
+
+    Skills outside the known vocabulary are ignored; the mask is computed
+    once at insert time so read paths never re-parse the JSON column.
+    """
+    if isinstance(skills, str):
+        skills = _skills_decode(skills)
+
+    mask = 0
+    for skill in skills or []:
+        mask |= config.SKILL_TO_BIT.get(str(skill).lower().strip(), 0)
+
+    return mask.to_bytes((len(config.SKILL_TO_BIT) + 7) // 8, 'little')
+
+
+# Unit separator between stored skill names: splitting is 3-5x faster
+# than json.loads and skills never contain control characters
+SKILL_DELIMITER = '\x1f'
+
+
+def _skills_encode(skills) -> Optional[str]:
+    """
+    Encode a skill list for storage as a delimiter-joined string.
+
+    Accepts lists or pre-serialized JSON strings from older callers.
+    """
+    if skills is None:
+        return None
+    if isinstance(skills, str):
+        try:
+            skills = json.loads(skills)
+        except (ValueError, TypeError):
+            return skills
+    return SKILL_DELIMITER.join(str(skill) for skill in skills)
+
+
+def _skills_decode(value) -> List[str]:
+    """
+    Decode a stored skills column back into a list.
+
+    Handles the delimiter format, legacy JSON rows and values already
+    decoded upstream.
+    """
+    if not value:
+        return []
+    if not isinstance(value, str):
+        return list(value)
+    if value[0] in '[{':
+        # Legacy row written as JSON before the format change
+        try:
+            return json.loads(value)
+        except (ValueError, TypeError):
+            pass
+    return value.split(SKILL_DELIMITER)
+
+
+def _decode_row_skills(row: Dict) -> Dict:
+    """Decode any skills columns in a row dict, in place."""
+    for column in ('extracted_skills', 'required_skills', 'matched_skills'):
+        if column in row:
+            row[column] = _skills_decode(row[column])
+    return row
+
+
+# Hot-path SQL hoisted to module constants: passing the identical string
+# object on every call lets sqlite3's per-connection statement cache hit
+# instead of re-parsing the statement. Upserts update conflicting rows
+# in place rather than INSERT OR REPLACE's delete+reinsert, preserving
+# rowids, created_at and foreign-key references.
+SQL_INSERT_RESUME = '''
+    INSERT INTO resumes
+    (resume_id, candidate_name, email, phone, content, content_sha256,
+     extracted_skills, extracted_skills_bits, clean_text, embedding,
+     embedding_offset, experience_years)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(resume_id) DO UPDATE SET
+        candidate_name = excluded.candidate_name,
+        email = excluded.email,
+        phone = excluded.phone,
+        content = excluded.content,
+        content_sha256 = excluded.content_sha256,
+        extracted_skills = excluded.extracted_skills,
+        extracted_skills_bits = excluded.extracted_skills_bits,
+        clean_text = excluded.clean_text,
+        embedding = excluded.embedding,
+        embedding_offset = excluded.embedding_offset,
+        experience_years = excluded.experience_years
+'''
+
+SQL_INSERT_JOB = '''
+    INSERT INTO job_descriptions
+    (job_id, title, description, description_sha256, required_skills,
+     required_skills_bits, clean_text, embedding)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(job_id) DO UPDATE SET
+        title = excluded.title,
+        description = excluded.description,
+        description_sha256 = excluded.description_sha256,
+        required_skills = excluded.required_skills,
+        required_skills_bits = excluded.required_skills_bits,
+        clean_text = excluded.clean_text,
+        embedding = excluded.embedding
+'''
+
+SQL_INSERT_SCREENING_RESULT = '''
+    INSERT INTO screening_results
+    (job_id, resume_id, skill_match_score, semantic_similarity_score,
+     experience_score, overall_score, rank, matched_skills)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_GET_RESUME = 'SELECT * FROM resumes WHERE resume_id = ?'
+SQL_GET_JOB = 'SELECT * FROM job_descriptions WHERE job_id = ?'
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection that returns itself to its pool on close()."""
+
+    _pool = None
+
+    def close(self):
+        """Release the connection back to the pool instead of closing."""
+        if self._pool is not None:
+            # Drop any uncommitted state before the next borrower
+            self.rollback()
+            try:
+                self._pool.put_nowait(self)
+                return
+            except queue.Full:
+                pass
+        sqlite3.Connection.close(self)
+
+
 class Database:
     """Database manager for resume screening system."""
     
@@ -22,8 +170,35 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path or config.DATABASE_PATH
+        self._pool = queue.Queue(maxsize=config.DB_POOL_SIZE)
+
+        # All writes funnel through one lock-guarded connection; reads
+        # run in parallel on pooled connections under WAL
+        self._write_lock = threading.Lock()
+        self._write_conn = None
+
         self.ensure_database_exists()
         self.init_tables()
+
+        # Pooled connections outlive their borrowers, so make sure WAL
+        # state is checkpointed and handles are released at shutdown
+        atexit.register(self.close)
+
+    def close(self):
+        """Close every pooled connection and the writer for real."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            # Detach from the pool so close() doesn't re-enqueue
+            conn._pool = None
+            conn.close()
     
     def ensure_database_exists(self):
         """Create database directory if it doesn't exist."""
@@ -31,10 +206,62 @@ class Database:
         db_dir.mkdir(parents=True, exist_ok=True)
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Get a database connection with row factory.
+
+        Connections are pooled: close() releases them back for reuse, so
+        request handlers keep warm page caches instead of paying
+        connection setup per query.
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            check_same_thread=False,
+            cached_statements=256
+        )
         conn.row_factory = sqlite3.Row
+        conn._pool = self._pool
+        self._apply_pragmas(conn)
         return conn
+
+    @contextmanager
+    def write_connection(self):
+        """
+        Borrow the process-wide writer connection.
+
+        SQLite allows one writer at a time, so funnelling every write
+        through a single lock-guarded connection replaces SQLITE_BUSY
+        contention between threads with an orderly queue, while reads
+        keep running in parallel on the pooled connections under WAL.
+        """
+        with self._write_lock:
+            if self._write_conn is None:
+                conn = sqlite3.connect(
+                    self.db_path,
+                    check_same_thread=False,
+                    cached_statements=256
+                )
+                conn.row_factory = sqlite3.Row
+                self._apply_pragmas(conn)
+                self._write_conn = conn
+            try:
+                yield self._write_conn
+            except Exception:
+                self._write_conn.rollback()
+                raise
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """Apply concurrency and cache PRAGMAs to a new connection."""
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-64000')
     
     def init_tables(self):
         """Initialize database tables."""
@@ -48,7 +275,9 @@ class Database:
                 job_id TEXT UNIQUE NOT NULL,
                 title TEXT NOT NULL,
                 description TEXT NOT NULL,
+                description_sha256 TEXT,
                 required_skills TEXT,
+                required_skills_bits BLOB,
                 clean_text TEXT,
                 embedding BLOB,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -64,9 +293,12 @@ class Database:
                 email TEXT,
                 phone TEXT,
                 content TEXT NOT NULL,
+                content_sha256 TEXT,
                 extracted_skills TEXT,
+                extracted_skills_bits BLOB,
                 clean_text TEXT,
                 embedding BLOB,
+                embedding_offset INTEGER,
                 experience_years REAL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
@@ -90,6 +322,98 @@ class Database:
             )
         ''')
         
+        # Add bitmask and content-hash columns to databases created
+        # before they existed
+        self._ensure_column(cursor, 'job_descriptions', 'required_skills_bits', 'BLOB')
+        self._ensure_column(cursor, 'job_descriptions', 'description_sha256', 'TEXT')
+        self._ensure_column(cursor, 'resumes', 'extracted_skills_bits', 'BLOB')
+        self._ensure_column(cursor, 'resumes', 'content_sha256', 'TEXT')
+        self._ensure_column(cursor, 'resumes', 'embedding_offset', 'INTEGER')
+
+        # Normalized skill vocabulary plus junction tables, so skill
+        # membership can be queried relationally (joins / INTERSECT)
+        # instead of JSON-parsing the text columns
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS skills (
+                skill_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS resume_skills (
+                resume_id TEXT NOT NULL,
+                skill_id INTEGER NOT NULL,
+                PRIMARY KEY (resume_id, skill_id),
+                FOREIGN KEY (skill_id) REFERENCES skills(skill_id)
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id TEXT NOT NULL,
+                skill_id INTEGER NOT NULL,
+                PRIMARY KEY (job_id, skill_id),
+                FOREIGN KEY (skill_id) REFERENCES skills(skill_id)
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_resume_skills_skill
+            ON resume_skills(skill_id)
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_job_skills_skill
+            ON job_skills(skill_id)
+        ''')
+
+        # Single-row counters maintained by triggers, so get_stats is a
+        # constant-time lookup instead of three full COUNT(*) scans
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS counts (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                resumes INTEGER NOT NULL,
+                jobs INTEGER NOT NULL,
+                screenings INTEGER NOT NULL
+            )
+        ''')
+
+        # Seed from the real counts the first time (covers databases
+        # created before the counters existed)
+        cursor.execute('''
+            INSERT INTO counts (id, resumes, jobs, screenings)
+            SELECT 1,
+                   (SELECT COUNT(*) FROM resumes),
+                   (SELECT COUNT(*) FROM job_descriptions),
+                   (SELECT COUNT(*) FROM screening_results)
+            WHERE NOT EXISTS (SELECT 1 FROM counts)
+        ''')
+
+        for table, column in (('resumes', 'resumes'),
+                              ('job_descriptions', 'jobs'),
+                              ('screening_results', 'screenings')):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_count_insert
+                AFTER INSERT ON {table} BEGIN
+                    UPDATE counts SET {column} = {column} + 1;
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_count_delete
+                AFTER DELETE ON {table} BEGIN
+                    UPDATE counts SET {column} = {column} - 1;
+                END
+            ''')
+
+        # Embedding Cache Table (content-addressed by SHA-256 of the text)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                hash BLOB PRIMARY KEY,
+                vec BLOB NOT NULL
+            )
+        ''')
+
         # Create indexes for better query performance
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_job_id 
@@ -100,45 +424,138 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_resume_id 
             ON screening_results(resume_id)
         ''')
+
+        # Covering index so ranked result reads walk (job_id, rank)
+        # directly and LIMIT stops the scan early
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_results_job_rank
+            ON screening_results(job_id, rank)
+        ''')
         
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_overall_score 
+            CREATE INDEX IF NOT EXISTS idx_overall_score
             ON screening_results(overall_score DESC)
         ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_resume_content_hash
+            ON resumes(content_sha256)
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_job_description_hash
+            ON job_descriptions(description_sha256)
+        ''')
         
         conn.commit()
         conn.close()
-    
-    def insert_job_description(self, job_data: Dict) -> int:
+
+    def _ensure_column(self, cursor, table: str, column: str, col_type: str):
+        """Add a column to an existing table if it's missing."""
+        columns = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+        if column not in columns:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {col_type}')
+
+    def _intern_skills(self, cursor, skills) -> List[int]:
         """
-        Insert a job description into the database.
-        
+        Map skill names to stable integer ids, creating rows as needed.
+
         Args:
-            job_data: Dictionary containing job information
-            
+            cursor: Open cursor inside the caller's transaction
+            skills: Skill list (or its JSON-string form)
+
         Returns:
-            ID of inserted job
+            List of skill_id values for the given skills
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO job_descriptions 
-            (job_id, title, description, required_skills, clean_text, embedding)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
+        if isinstance(skills, str):
+            skills = _skills_decode(skills)
+
+        names = sorted({
+            str(skill).lower().strip()
+            for skill in skills or []
+            if str(skill).strip()
+        })
+        if not names:
+            return []
+
+        cursor.executemany(
+            'INSERT OR IGNORE INTO skills (name) VALUES (?)',
+            [(name,) for name in names]
+        )
+
+        placeholders = ','.join('?' * len(names))
+        rows = cursor.execute(
+            f'SELECT skill_id FROM skills WHERE name IN ({placeholders})',
+            names
+        )
+        return [row[0] for row in rows]
+
+    def _replace_junction_skills(self, cursor, table: str, key_column: str,
+                                 key: str, skill_ids: List[int]):
+        """Rewrite the junction rows for one resume or job."""
+        cursor.execute(f'DELETE FROM {table} WHERE {key_column} = ?', (key,))
+        cursor.executemany(
+            f'INSERT OR IGNORE INTO {table} ({key_column}, skill_id) VALUES (?, ?)',
+            [(key, skill_id) for skill_id in skill_ids]
+        )
+
+    @staticmethod
+    def _job_row(job_data: Dict) -> Tuple:
+        """Build the bound-parameter tuple for a job INSERT."""
+        return (
             job_data.get('job_id'),
             job_data.get('title'),
             job_data.get('description'),
-            json.dumps(job_data.get('required_skills', [])),
+            _content_hash(job_data.get('description')),
+            _skills_encode(job_data.get('required_skills', [])),
+            _skills_to_bits(job_data.get('required_skills')),
             job_data.get('clean_text'),
             job_data.get('embedding')
-        ))
-        
-        job_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
+        )
+
+    @staticmethod
+    def _resume_row(resume_data: Dict) -> Tuple:
+        """Build the bound-parameter tuple for a resume INSERT."""
+        return (
+            resume_data.get('resume_id'),
+            resume_data.get('candidate_name'),
+            resume_data.get('email'),
+            resume_data.get('phone'),
+            resume_data.get('content'),
+            _content_hash(resume_data.get('content')),
+            _skills_encode(resume_data.get('extracted_skills', [])),
+            _skills_to_bits(resume_data.get('extracted_skills')),
+            resume_data.get('clean_text'),
+            resume_data.get('embedding'),
+            resume_data.get('embedding_offset'),
+            resume_data.get('experience_years', 0.0)
+        )
+
+    def insert_job_description(self, job_data: Dict) -> int:
+        """
+        Insert a job description into the database.
+
+        Args:
+            job_data: Dictionary containing job information
+
+        Returns:
+            ID of inserted job
+        """
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(SQL_INSERT_JOB, self._job_row(job_data))
+
+            job_id = cursor.lastrowid
+
+            # Keep the normalized junction rows in step with the JSON column
+            skill_ids = self._intern_skills(cursor, job_data.get('required_skills'))
+            self._replace_junction_skills(
+                cursor, 'job_skills', 'job_id', job_data.get('job_id'), skill_ids
+            )
+
+            conn.commit()
+
         return job_id
     
     def insert_resume(self, resume_data: Dict) -> int:
@@ -151,32 +568,87 @@ class Database:
         Returns:
             ID of inserted resume
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO resumes 
-            (resume_id, candidate_name, email, phone, content, 
-             extracted_skills, clean_text, embedding, experience_years)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_data.get('resume_id'),
-            resume_data.get('candidate_name'),
-            resume_data.get('email'),
-            resume_data.get('phone'),
-            resume_data.get('content'),
-            json.dumps(resume_data.get('extracted_skills', [])),
-            resume_data.get('clean_text'),
-            resume_data.get('embedding'),
-            resume_data.get('experience_years', 0.0)
-        ))
-        
-        resume_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(SQL_INSERT_RESUME, self._resume_row(resume_data))
+
+            resume_id = cursor.lastrowid
+
+            # Keep the normalized junction rows in step with the JSON column
+            skill_ids = self._intern_skills(
+                cursor, resume_data.get('extracted_skills')
+            )
+            self._replace_junction_skills(
+                cursor, 'resume_skills', 'resume_id',
+                resume_data.get('resume_id'), skill_ids
+            )
+
+            conn.commit()
+
         return resume_id
     
+    def insert_resumes_bulk(self, resumes: List[Dict]):
+        """
+        Insert many resumes inside a single transaction.
+
+        One executemany plus one commit replaces a commit (and fsync)
+        per row, which is where bulk upload time goes in SQLite.
+
+        Args:
+            resumes: List of resume dictionaries
+        """
+        if not resumes:
+            return
+
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.executemany(
+                SQL_INSERT_RESUME,
+                [self._resume_row(resume_data) for resume_data in resumes]
+            )
+
+            for resume_data in resumes:
+                skill_ids = self._intern_skills(
+                    cursor, resume_data.get('extracted_skills')
+                )
+                self._replace_junction_skills(
+                    cursor, 'resume_skills', 'resume_id',
+                    resume_data.get('resume_id'), skill_ids
+                )
+
+            conn.commit()
+
+    def insert_jobs_bulk(self, jobs: List[Dict]):
+        """
+        Insert many job descriptions inside a single transaction.
+
+        Args:
+            jobs: List of job description dictionaries
+        """
+        if not jobs:
+            return
+
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.executemany(
+                SQL_INSERT_JOB,
+                [self._job_row(job_data) for job_data in jobs]
+            )
+
+            for job_data in jobs:
+                skill_ids = self._intern_skills(
+                    cursor, job_data.get('required_skills')
+                )
+                self._replace_junction_skills(
+                    cursor, 'job_skills', 'job_id', job_data.get('job_id'),
+                    skill_ids
+                )
+
+            conn.commit()
+
     def insert_screening_result(self, result_data: Dict) -> int:
         """
         Insert screening result into the database.
@@ -187,31 +659,159 @@ class Database:
         Returns:
             ID of inserted result
         """
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(SQL_INSERT_SCREENING_RESULT, (
+                result_data.get('job_id'),
+                result_data.get('resume_id'),
+                result_data.get('skill_match_score'),
+                result_data.get('semantic_similarity_score'),
+                result_data.get('experience_score'),
+                result_data.get('overall_score'),
+                result_data.get('rank'),
+                _skills_encode(result_data.get('matched_skills', []))
+            ))
+
+            result_id = cursor.lastrowid
+            conn.commit()
+
+        return result_id
+    
+    def insert_screening_results_batch(self, job_id: str, results: List[Dict]):
+        """
+        Replace the screening results for a job in one transaction.
+
+        Clears previous results and inserts the new batch via a single
+        executemany, so the whole write costs one commit instead of one
+        per result.
+
+        Args:
+            job_id: Job identifier whose results are being replaced
+            results: List of screening result dictionaries
+        """
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                DELETE FROM screening_results WHERE job_id = ?
+            ''', (job_id,))
+
+            cursor.executemany(SQL_INSERT_SCREENING_RESULT, [
+                (
+                    result.get('job_id'),
+                    result.get('resume_id'),
+                    result.get('skill_match_score'),
+                    result.get('semantic_similarity_score'),
+                    result.get('experience_score'),
+                    result.get('overall_score'),
+                    result.get('rank'),
+                    _skills_encode(result.get('matched_skills', []))
+                )
+                for result in results
+            ])
+
+            conn.commit()
+
+    def commit_screening_batch(self, job_id: str, rows: List[Dict]):
+        """
+        Replace a job's screening results, ranking inside SQL.
+
+        Rows need no precomputed rank: they are staged into a temp table
+        and inserted with ROW_NUMBER() OVER (ORDER BY overall_score
+        DESC), so the sort and rank assignment happen in one SQL
+        statement instead of a Python sort followed by per-row writes.
+
+        Args:
+            job_id: Job identifier whose results are being replaced
+            rows: Screening result dictionaries (rank keys are ignored)
+        """
+        with self.write_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                DELETE FROM screening_results WHERE job_id = ?
+            ''', (job_id,))
+
+            cursor.execute('''
+                CREATE TEMP TABLE IF NOT EXISTS temp_scores (
+                    resume_id TEXT,
+                    skill_match_score REAL,
+                    semantic_similarity_score REAL,
+                    experience_score REAL,
+                    overall_score REAL,
+                    matched_skills TEXT
+                )
+            ''')
+            cursor.execute('DELETE FROM temp_scores')
+
+            cursor.executemany('''
+                INSERT INTO temp_scores VALUES (?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    row.get('resume_id'),
+                    row.get('skill_match_score'),
+                    row.get('semantic_similarity_score'),
+                    row.get('experience_score'),
+                    row.get('overall_score'),
+                    _skills_encode(row.get('matched_skills', []))
+                )
+                for row in rows
+            ])
+
+            cursor.execute('''
+                INSERT INTO screening_results
+                (job_id, resume_id, skill_match_score,
+                 semantic_similarity_score, experience_score,
+                 overall_score, rank, matched_skills)
+                SELECT ?, resume_id, skill_match_score,
+                       semantic_similarity_score, experience_score,
+                       overall_score,
+                       ROW_NUMBER() OVER (ORDER BY overall_score DESC),
+                       matched_skills
+                FROM temp_scores
+            ''', (job_id,))
+
+            conn.commit()
+
+    def get_cached_embedding(self, text_hash: bytes) -> Optional[bytes]:
+        """
+        Look up a cached embedding by content hash.
+
+        Args:
+            text_hash: SHA-256 digest of the source text
+
+        Returns:
+            Serialized embedding bytes or None
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
         cursor.execute('''
-            INSERT INTO screening_results 
-            (job_id, resume_id, skill_match_score, semantic_similarity_score,
-             experience_score, overall_score, rank, matched_skills)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            result_data.get('job_id'),
-            result_data.get('resume_id'),
-            result_data.get('skill_match_score'),
-            result_data.get('semantic_similarity_score'),
-            result_data.get('experience_score'),
-            result_data.get('overall_score'),
-            result_data.get('rank'),
-            json.dumps(result_data.get('matched_skills', []))
-        ))
-        
-        result_id = cursor.lastrowid
-        conn.commit()
+            SELECT vec FROM embedding_cache WHERE hash = ?
+        ''', (text_hash,))
+
+        row = cursor.fetchone()
         conn.close()
-        
-        return result_id
-    
+
+        if row:
+            return row['vec']
+        return None
+
+    def insert_cached_embedding(self, text_hash: bytes, vec: bytes):
+        """
+        Store a serialized embedding in the cache.
+
+        Args:
+            text_hash: SHA-256 digest of the source text
+            vec: Serialized embedding bytes
+        """
+        with self.write_connection() as conn:
+            conn.execute('''
+                INSERT OR IGNORE INTO embedding_cache (hash, vec) VALUES (?, ?)
+            ''', (text_hash, vec))
+            conn.commit()
+
     def get_job_description(self, job_id: str) -> Optional[Dict]:
         """
         Retrieve job description by ID.
@@ -225,15 +825,13 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM job_descriptions WHERE job_id = ?
-        ''', (job_id,))
+        cursor.execute(SQL_GET_JOB, (job_id,))
         
         row = cursor.fetchone()
         conn.close()
         
         if row:
-            return dict(row)
+            return _decode_row_skills(dict(row))
         return None
     
     def get_resume(self, resume_id: str) -> Optional[Dict]:
@@ -249,17 +847,97 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT * FROM resumes WHERE resume_id = ?
-        ''', (resume_id,))
+        cursor.execute(SQL_GET_RESUME, (resume_id,))
         
         row = cursor.fetchone()
         conn.close()
         
         if row:
-            return dict(row)
+            return _decode_row_skills(dict(row))
         return None
     
+    def get_resumes_by_ids(self, resume_ids: List[str]) -> List[Dict]:
+        """
+        Retrieve multiple resumes in one query.
+
+        Ids are chunked to stay under SQLite's bound-variable limit;
+        missing ids are silently skipped. Rows come back in input order.
+
+        Args:
+            resume_ids: Resume identifiers to fetch
+
+        Returns:
+            List of resume dictionaries for the ids that exist
+        """
+        if not resume_ids:
+            return []
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        by_id = {}
+        for start in range(0, len(resume_ids), 900):
+            chunk = resume_ids[start:start + 900]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT * FROM resumes WHERE resume_id IN ({placeholders})',
+                chunk
+            )
+            for row in cursor.fetchall():
+                by_id[row['resume_id']] = _decode_row_skills(dict(row))
+
+        conn.close()
+
+        return [by_id[rid] for rid in resume_ids if rid in by_id]
+
+    def find_resume_by_content_hash(self, content_hash: str) -> Optional[Dict]:
+        """
+        Find an already-processed resume with identical content.
+
+        Args:
+            content_hash: SHA-256 hex digest of the raw content
+
+        Returns:
+            Resume data or None
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT * FROM resumes WHERE content_sha256 = ? LIMIT 1
+        ''', (content_hash,))
+
+        row = cursor.fetchone()
+        conn.close()
+
+        if row:
+            return _decode_row_skills(dict(row))
+        return None
+
+    def find_job_by_content_hash(self, content_hash: str) -> Optional[Dict]:
+        """
+        Find an already-processed job with identical description.
+
+        Args:
+            content_hash: SHA-256 hex digest of the raw description
+
+        Returns:
+            Job description data or None
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT * FROM job_descriptions WHERE description_sha256 = ? LIMIT 1
+        ''', (content_hash,))
+
+        row = cursor.fetchone()
+        conn.close()
+
+        if row:
+            return _decode_row_skills(dict(row))
+        return None
+
     def get_all_resumes(self) -> List[Dict]:
         """
         Retrieve all resumes from database.
@@ -274,8 +952,107 @@ class Database:
         rows = cursor.fetchall()
         conn.close()
         
-        return [dict(row) for row in rows]
+        return [_decode_row_skills(dict(row)) for row in rows]
     
+    def iter_resume_embeddings(self, batch_size: int = 256):
+        """
+        Iterate over resumes in fixed-size batches of slim rows.
+
+        Fetches only the columns screening needs (no raw content or
+        clean_text), so scanning a large pool never materializes every
+        full row in memory at once.
+
+        Args:
+            batch_size: Number of rows per yielded batch
+
+        Yields:
+            Lists of resume dictionaries, at most batch_size each
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT resume_id, extracted_skills, extracted_skills_bits,
+                       experience_years, embedding, embedding_offset
+                FROM resumes
+            ''')
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [_decode_row_skills(dict(row)) for row in rows]
+        finally:
+            conn.close()
+
+    def dump_embeddings_matrix(self, deserialize, path=None) -> Tuple[str, int]:
+        """
+        Dump every resume embedding into a pre-normalized float32 matrix.
+
+        Writes `<path>.npy` holding the (N, dim) row-normalized matrix
+        and `<path>.ids.npy` holding the parallel resume_id array (SoA
+        layout). Screening can then memory-map the matrix and score a
+        job against the whole pool with one matrix-vector product
+        instead of rehydrating BLOBs row by row.
+
+        Args:
+            deserialize: Callable turning a stored embedding blob into a
+                numpy vector (EmbeddingGenerator.deserialize_embedding)
+            path: Output path stem (defaults to config.VECTOR_INDEX_PATH)
+
+        Returns:
+            Tuple of (matrix path, number of rows written)
+        """
+        path = str(path or config.VECTOR_INDEX_PATH)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT resume_id, embedding FROM resumes
+            WHERE embedding IS NOT NULL ORDER BY id
+        ''')
+        rows = cursor.fetchall()
+        conn.close()
+
+        ids = [row['resume_id'] for row in rows]
+        if rows:
+            matrix = np.vstack([
+                np.asarray(deserialize(row['embedding']), dtype=np.float32)
+                for row in rows
+            ])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.clip(norms, 1e-12, None, out=norms)
+            matrix /= norms
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        np.save(path + '.npy', matrix, allow_pickle=False)
+        np.save(path + '.ids.npy', np.array(ids), allow_pickle=False)
+
+        return path + '.npy', len(ids)
+
+    def load_embeddings_matrix(self, path=None):
+        """
+        Memory-map a matrix written by dump_embeddings_matrix.
+
+        Args:
+            path: Path stem used for the dump (defaults to
+                config.VECTOR_INDEX_PATH)
+
+        Returns:
+            Tuple of (resume_id list, read-only memmapped (N, dim)
+            matrix), or (None, None) if no dump exists
+        """
+        path = str(path or config.VECTOR_INDEX_PATH)
+        if not Path(path + '.npy').exists():
+            return None, None
+
+        matrix = np.load(path + '.npy', mmap_mode='r')
+        ids = np.load(path + '.ids.npy', allow_pickle=False).tolist()
+
+        return ids, matrix
+
     def get_all_jobs(self) -> List[Dict]:
         """
         Retrieve all job descriptions from database.
@@ -290,24 +1067,87 @@ class Database:
         rows = cursor.fetchall()
         conn.close()
         
-        return [dict(row) for row in rows]
+        return [_decode_row_skills(dict(row)) for row in rows]
     
-    def get_screening_results(self, job_id: str) -> List[Dict]:
+    def list_resumes_meta(self) -> List[Dict]:
+        """
+        List lightweight resume metadata rows.
+
+        Projects only identity columns, skipping the multi-KB content,
+        clean_text and embedding BLOBs that listing callers never read.
+
+        Returns:
+            List of dictionaries with resume_id, candidate_name, email,
+            experience_years and created_at
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT resume_id, candidate_name, email, experience_years, created_at
+            FROM resumes ORDER BY created_at DESC
+        ''')
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [dict(row) for row in rows]
+
+    def list_jobs_meta(self) -> List[Dict]:
+        """
+        List job descriptions without their embedding BLOBs.
+
+        Returns:
+            List of dictionaries with job_id, title, description,
+            required_skills and created_at
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT job_id, title, description, required_skills, created_at
+            FROM job_descriptions ORDER BY created_at DESC
+        ''')
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [_decode_row_skills(dict(row)) for row in rows]
+
+    def get_screening_results(self, job_id: str,
+                              limit: int = None) -> List[Dict]:
         """
         Get screening results for a job, ordered by rank.
-        
+
+        Ordering by rank alone (scores rank ties deterministically at
+        insert time) lets SQLite walk the (job_id, rank) index and, with
+        a limit, stop after the first K rows instead of sorting all N.
+
         Args:
             job_id: Job identifier
-            
+            limit: Return at most this many top-ranked rows (all if None)
+
         Returns:
             List of screening results with candidate details
         """
         conn = self.get_connection()
         cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                sr.*,
+
+        params = [job_id]
+        limit_clause = ''
+        if limit is not None:
+            limit_clause = 'LIMIT ?'
+            params.append(int(limit))
+
+        cursor.execute(f'''
+            SELECT
+                sr.job_id,
+                sr.resume_id,
+                sr.skill_match_score,
+                sr.semantic_similarity_score,
+                sr.experience_score,
+                sr.overall_score,
+                sr.rank,
+                sr.matched_skills,
+                sr.screened_at,
                 r.candidate_name,
                 r.email,
                 r.phone,
@@ -315,13 +1155,14 @@ class Database:
             FROM screening_results sr
             JOIN resumes r ON sr.resume_id = r.resume_id
             WHERE sr.job_id = ?
-            ORDER BY sr.overall_score DESC, sr.rank ASC
-        ''', (job_id,))
-        
+            ORDER BY sr.rank ASC
+            {limit_clause}
+        ''', params)
+
         rows = cursor.fetchall()
         conn.close()
         
-        return [dict(row) for row in rows]
+        return [_decode_row_skills(dict(row)) for row in rows]
     
     def clear_screening_results(self, job_id: str):
         """
@@ -330,15 +1171,11 @@ class Database:
         Args:
             job_id: Job identifier
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            DELETE FROM screening_results WHERE job_id = ?
-        ''', (job_id,))
-        
-        conn.commit()
-        conn.close()
+        with self.write_connection() as conn:
+            conn.execute('''
+                DELETE FROM screening_results WHERE job_id = ?
+            ''', (job_id,))
+            conn.commit()
     
     def get_stats(self) -> Dict:
         """
@@ -349,20 +1186,14 @@ class Database:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM job_descriptions')
-        job_count = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM resumes')
-        resume_count = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM screening_results')
-        screening_count = cursor.fetchone()[0]
-        
+
+        # Trigger-maintained counters: one row read regardless of size
+        cursor.execute('SELECT resumes, jobs, screenings FROM counts')
+        row = cursor.fetchone()
         conn.close()
-        
+
         return {
-            'total_jobs': job_count,
-            'total_resumes': resume_count,
-            'total_screenings': screening_count
+            'total_jobs': row['jobs'],
+            'total_resumes': row['resumes'],
+            'total_screenings': row['screenings']
         }
@@ -3,12 +3,63 @@ Embedding generation module for Resume Screening System.
 Uses sentence-transformers to generate semantic embeddings for text.
 """
 
+import os
 import numpy as np
 from typing import List, Union
 from sentence_transformers import SentenceTransformer
 import pickle
 import config
 
+# Optional ONNX Runtime backend: exporting the transformer and
+# quantizing its weights to int8 gives 2-4x CPU throughput at <1%
+# accuracy loss. Falls back to the regular SentenceTransformer path
+# when optimum/onnxruntime aren't installed.
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    import onnxruntime
+    from transformers import AutoTokenizer
+    ONNX_AVAILABLE = True
+except Exception:
+    ONNX_AVAILABLE = False
+
+# Format marker for raw float16 embedding blobs; blobs without it are
+# legacy pickle payloads from before the format change
+EMBEDDING_BLOB_MAGIC = b'EMB1'
+
+# Marker for int8-quantized blobs: magic, one float32 max-abs scale,
+# then int8 values. Half the size of float16 again, at ~0.1% cosine error
+# for normalized sentence embeddings.
+EMBEDDING_BLOB_MAGIC_INT8 = b'EMB8'
+
+
+def _cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+    """Cosine similarity, 0.0 when either vector is all zeros."""
+    norm1 = np.linalg.norm(embedding1)
+    norm2 = np.linalg.norm(embedding2)
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return np.dot(embedding1, embedding2) / (norm1 * norm2)
+
+
+def _dot_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+    """Raw dot product (equals cosine for pre-normalized inputs)."""
+    return np.dot(embedding1, embedding2)
+
+
+def _euclidean_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+    """Euclidean distance folded into a 0-1 similarity."""
+    return 1 / (1 + np.linalg.norm(embedding1 - embedding2))
+
+
+# Method-name dispatch resolved once per call instead of a string
+# comparison chain inside the similarity hot path
+_SIMILARITY_METHODS = {
+    'cosine': _cosine_similarity,
+    'dot': _dot_similarity,
+    'euclidean': _euclidean_similarity,
+}
+
 
 class EmbeddingGenerator:
     """
@@ -16,29 +67,178 @@ class EmbeddingGenerator:
     Supports various transformer models for encoding text into dense vectors.
     """
     
-    def __init__(self, model_name: str = None):
+    # Rough character cap (~6 chars/token at 256 tokens) applied before
+    # tokenization, so huge documents don't pay tokenizer cost for text
+    # the model's max_seq_length would discard anyway
+    MAX_EMBED_CHARS = 256 * 6
+
+    # Resume section weights: skills and experience dominate the signal
+    SECTION_WEIGHTS = {
+        'skills': 0.35,
+        'experience': 0.35,
+        'education': 0.15,
+        'projects': 0.10,
+        'other': 0.05
+    }
+    
+    def __init__(self, model_name: str = None, use_onnx: bool = None):
         """
         Initialize the embedding generator.
-        
+
         Args:
             model_name: Name of the sentence-transformer model to use
                        Default: all-MiniLM-L6-v2 (fast and accurate)
+            use_onnx: Run inference through a quantized ONNX session
+                     Default: config.USE_ONNX_EMBEDDINGS
         """
         self.model_name = model_name or config.EMBEDDING_MODEL
-        
-        # Load the sentence transformer model
-        print(f"Loading embedding model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
+        if use_onnx is None:
+            use_onnx = config.USE_ONNX_EMBEDDINGS
+        self.use_onnx = use_onnx and ONNX_AVAILABLE
+
+        self.model = None
+        self._ort_session = None
+        self._tokenizer = None
+        self._dimension = None
+        self._zero = None
+
+        if self.use_onnx:
+            try:
+                print(f"Loading embedding model (ONNX int8): {self.model_name}")
+                self._init_onnx()
+            except Exception as e:
+                print(f"Warning: ONNX backend unavailable ({e}). "
+                      f"Using SentenceTransformer.")
+                self.use_onnx = False
+
+        if not self.use_onnx:
+            # Load the sentence transformer model
+            print(f"Loading embedding model: {self.model_name}")
+            self.model = SentenceTransformer(self.model_name)
+
+            # MiniLM's positional cap: never pad batches past it
+            self.model.max_seq_length = min(self.model.max_seq_length, 256)
+
+            if config.EMBEDDING_HALF_PRECISION:
+                self._apply_half_precision()
         print(f"Model loaded successfully. Embedding dimension: {self.get_embedding_dimension()}")
-    
+
+    def _apply_half_precision(self):
+        """
+        Cast the transformer to half precision for faster encoding.
+
+        Uses fp16 on CUDA and bfloat16 on CPU (fp16 emulation is slow on
+        CPU, while bf16 keeps fp32's exponent range). Falls back to fp32
+        with a warning if the cast fails.
+        """
+        try:
+            import torch
+            if torch.cuda.is_available():
+                self.model = self.model.half()
+                print("✓ Embedding model cast to fp16 (CUDA)")
+            else:
+                self.model = self.model.bfloat16()
+                print("✓ Embedding model cast to bfloat16 (CPU)")
+        except Exception as e:
+            print(f"Warning: half-precision cast failed ({e}). Using fp32.")
+
+    def _init_onnx(self):
+        """Export, quantize and load the model as an ONNX Runtime session."""
+        model_dir = config.ONNX_MODEL_DIR / self.model_name.replace('/', '_')
+        quantized_path = model_dir / 'model_quantized.onnx'
+
+        # The transformers hub id for sentence-transformers shorthand names
+        hub_name = self.model_name
+        if '/' not in hub_name:
+            hub_name = f'sentence-transformers/{hub_name}'
+
+        if not quantized_path.exists():
+            # One-time export + dynamic int8 quantization, cached on disk
+            model_dir.mkdir(parents=True, exist_ok=True)
+            ORTModelForFeatureExtraction.from_pretrained(
+                hub_name, export=True
+            ).save_pretrained(model_dir)
+            quantize_dynamic(
+                model_dir / 'model.onnx',
+                quantized_path,
+                weight_type=QuantType.QInt8
+            )
+
+        self._tokenizer = AutoTokenizer.from_pretrained(hub_name)
+
+        # Fold/fuse the graph at load time and pin the thread pool to
+        # the machine rather than ORT's conservative default
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+
+        self._ort_session = onnxruntime.InferenceSession(
+            str(quantized_path), session_options,
+            providers=['CPUExecutionProvider']
+        )
+        self._ort_input_names = {
+            inp.name for inp in self._ort_session.get_inputs()
+        }
+
+        # Probe once to learn the embedding dimension
+        self._dimension = self._encode_onnx(['probe']).shape[1]
+
+    def _encode_onnx(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Encode texts through the ONNX session.
+
+        Applies the same mean pooling over the attention mask and unit
+        normalization that the SentenceTransformer pipeline performs.
+
+        Args:
+            texts: Input texts
+            batch_size: Number of texts per session run
+
+        Returns:
+            Numpy array of shape (n_texts, embedding_dim)
+        """
+        outputs = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            encoded = self._tokenizer(
+                batch, padding=True, truncation=True,
+                max_length=256, return_tensors='np'
+            )
+            feeds = {
+                name: encoded[name].astype(np.int64)
+                for name in self._ort_input_names
+                if name in encoded
+            }
+            hidden = self._ort_session.run(None, feeds)[0]
+
+            # Mean pooling over real (non-padding) tokens
+            mask = encoded['attention_mask'][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            pooled /= np.where(norms == 0, 1, norms)
+            outputs.append(pooled.astype(np.float32))
+
+        return np.vstack(outputs)
+
     def get_embedding_dimension(self) -> int:
         """
         Get the dimension of embeddings produced by the model.
-        
+
         Returns:
             Embedding dimension size
         """
-        return self.model.get_sentence_embedding_dimension()
+        if self._dimension is None:
+            self._dimension = self.model.get_sentence_embedding_dimension()
+        return self._dimension
+
+    def _zero_vector(self) -> np.ndarray:
+        """Copy of a cached float32 zero vector for empty-input paths."""
+        if self._zero is None:
+            self._zero = np.zeros(self.get_embedding_dimension(), dtype=np.float32)
+        return self._zero.copy()
     
     def generate_embedding(self, text: str) -> np.ndarray:
         """
@@ -52,14 +252,22 @@ class EmbeddingGenerator:
         """
         if not text or not text.strip():
             # Return zero vector for empty text
-            return np.zeros(self.get_embedding_dimension())
-        
-        # Generate embedding
-        embedding = self.model.encode(text, convert_to_numpy=True)
+            return self._zero_vector()
+
+        text = text[:self.MAX_EMBED_CHARS]
+
+        if self.use_onnx:
+            return self._encode_onnx([text])[0]
+
+        # Generate embedding, pre-normalized so cosine similarity
+        # downstream reduces to a bare dot product
+        embedding = self.model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        )
         return embedding
     
     def generate_embeddings(self, texts: List[str], 
-                          batch_size: int = 32,
+                          batch_size: int = 128,
                           show_progress: bool = False) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
@@ -74,15 +282,21 @@ class EmbeddingGenerator:
         """
         if not texts:
             return np.array([])
-        
-        # Generate embeddings in batches
+
+        texts = [text[:self.MAX_EMBED_CHARS] for text in texts]
+
+        if self.use_onnx:
+            return self._encode_onnx(texts, batch_size=batch_size)
+
+        # Generate embeddings in batches, pre-normalized to unit length
         embeddings = self.model.encode(
             texts,
             batch_size=batch_size,
             show_progress_bar=show_progress,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
-        
+
         return embeddings
     
     def compute_similarity(self, embedding1: np.ndarray, 
@@ -99,29 +313,12 @@ class EmbeddingGenerator:
         Returns:
             Similarity score
         """
-        if method == 'cosine':
-            # Cosine similarity
-            dot_product = np.dot(embedding1, embedding2)
-            norm1 = np.linalg.norm(embedding1)
-            norm2 = np.linalg.norm(embedding2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            return dot_product / (norm1 * norm2)
-        
-        elif method == 'dot':
-            # Dot product similarity
-            return np.dot(embedding1, embedding2)
-        
-        elif method == 'euclidean':
-            # Euclidean distance (converted to similarity)
-            distance = np.linalg.norm(embedding1 - embedding2)
-            # Convert distance to similarity (0 to 1 range)
-            return 1 / (1 + distance)
-        
-        else:
+        try:
+            similarity = _SIMILARITY_METHODS[method]
+        except KeyError:
             raise ValueError(f"Unknown similarity method: {method}")
+
+        return similarity(embedding1, embedding2)
     
     def compute_similarity_matrix(self, embeddings1: np.ndarray,
                                  embeddings2: np.ndarray,
@@ -157,9 +354,31 @@ class EmbeddingGenerator:
         
         return similarity_matrix
     
+    def build_index(self, embeddings: np.ndarray, ids: List[str],
+                    index_path: str = None):
+        """
+        Build a persistent ANN index over a set of embeddings.
+
+        Args:
+            embeddings: Matrix of shape (n, embedding_dim)
+            ids: Identifier per row
+            index_path: Where to persist the index (default:
+                       config.VECTOR_INDEX_PATH)
+
+        Returns:
+            A FaissIndex (HNSW when faiss is installed, exact NumPy
+            fallback otherwise), already saved to disk
+        """
+        from src.vector_index import FaissIndex
+
+        index = FaissIndex(self.get_embedding_dimension(), index_path)
+        index.add_batch(ids, np.asarray(embeddings, dtype=np.float32))
+        index.save()
+        return index
+
     def find_most_similar(self, query_embedding: np.ndarray,
-                         candidate_embeddings: np.ndarray,
-                         top_k: int = 5) -> List[tuple]:
+                         candidate_embeddings: np.ndarray = None,
+                         top_k: int = 5, index=None) -> List[tuple]:
         """
         Find most similar candidates to a query.
         
@@ -167,47 +386,130 @@ class EmbeddingGenerator:
             query_embedding: Query embedding vector
             candidate_embeddings: Array of candidate embeddings
             top_k: Number of top candidates to return
+            index: Optional FaissIndex; when given, searches it in
+                  O(log N) and returns (resume_id, score) tuples
             
         Returns:
-            List of (index, similarity_score) tuples
+            List of (index, similarity_score) tuples, or
+            (resume_id, similarity_score) when an index is supplied
         """
-        # Compute similarities
-        similarities = []
-        for idx, candidate_emb in enumerate(candidate_embeddings):
-            sim = self.compute_similarity(query_embedding, candidate_emb)
-            similarities.append((idx, sim))
-        
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top-k
-        return similarities[:top_k]
+        if index is not None:
+            return index.search(query_embedding, top_k)
+
+        candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+        if candidates.size == 0:
+            return []
+
+        # One GEMV over the whole candidate matrix instead of a Python
+        # loop calling compute_similarity per row
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query_norm = np.linalg.norm(query)
+        if query_norm > 0:
+            query = query / query_norm
+
+        row_norms = np.linalg.norm(candidates, axis=1, keepdims=True)
+        np.clip(row_norms, 1e-12, None, out=row_norms)
+        similarities = (candidates / row_norms) @ query
+
+        # Partial-select the top-k, then sort only those
+        top_k = min(top_k, len(similarities))
+        indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+        indices = indices[np.argsort(-similarities[indices])]
+
+        return [(int(idx), float(similarities[idx])) for idx in indices]
     
-    def serialize_embedding(self, embedding: np.ndarray) -> bytes:
+    def deserialize_embedding_batch(self, blobs: List[bytes]) -> np.ndarray:
+        """
+        Deserialize multiple stored embeddings into a single matrix.
+
+        Args:
+            blobs: List of serialized embedding blobs
+
+        Returns:
+            Numpy array of shape (n_blobs, embedding_dim)
+        """
+        if not blobs:
+            return np.zeros((0, self.get_embedding_dimension()))
+
+        # Homogeneous float16 batches (the common case once a database
+        # has been migrated) hydrate with one frombuffer over the joined
+        # bytes and one reshape, instead of a frombuffer + vstack row
+        # per blob
+        magic_len = len(EMBEDDING_BLOB_MAGIC)
+        first_len = len(blobs[0])
+        if all(
+            blob is not None
+            and len(blob) == first_len
+            and blob[:magic_len] == EMBEDDING_BLOB_MAGIC
+            for blob in blobs
+        ):
+            joined = b''.join(blob[magic_len:] for blob in blobs)
+            return np.frombuffer(joined, dtype=np.float16).reshape(
+                len(blobs), -1
+            ).astype(np.float32)
+
+        return np.vstack([self.deserialize_embedding(blob) for blob in blobs])
+
+    def serialize_embedding(self, embedding: np.ndarray,
+                           quantize_int8: bool = None) -> bytes:
         """
         Serialize embedding for database storage.
-        
+
+        Vectors are stored as raw float16 bytes, halving blob size and
+        I/O with negligible cosine-similarity error for sentence
+        embeddings. A format marker keeps legacy pickle rows decodable.
+
         Args:
             embedding: Numpy array embedding
-            
+            quantize_int8: Store int8 values with a per-vector scale
+                          instead of float16, for another 2x shrinkage.
+                          Defaults to config.EMBEDDING_QUANTIZE_INT8
+
         Returns:
             Serialized bytes
         """
-        return pickle.dumps(embedding)
-    
+        embedding = np.asarray(embedding, dtype=np.float32)
+
+        if quantize_int8 is None:
+            quantize_int8 = config.EMBEDDING_QUANTIZE_INT8
+
+        if quantize_int8:
+            scale = float(np.abs(embedding).max()) or 1.0
+            quantized = np.round(embedding / scale * 127).astype(np.int8)
+            return (EMBEDDING_BLOB_MAGIC_INT8
+                    + np.float32(scale).tobytes()
+                    + quantized.tobytes())
+
+        return EMBEDDING_BLOB_MAGIC + embedding.astype(np.float16).tobytes()
+
     def deserialize_embedding(self, embedding_bytes: bytes) -> np.ndarray:
         """
         Deserialize embedding from database.
-        
+
         Args:
             embedding_bytes: Serialized embedding
-            
+
         Returns:
-            Numpy array embedding
+            Numpy array embedding (float32)
         """
         if embedding_bytes is None:
-            return np.zeros(self.get_embedding_dimension())
-        
+            return self._zero_vector()
+
+        if embedding_bytes[:len(EMBEDDING_BLOB_MAGIC)] == EMBEDDING_BLOB_MAGIC:
+            # Upconvert to float32 so downstream math keeps full precision
+            return np.frombuffer(
+                embedding_bytes[len(EMBEDDING_BLOB_MAGIC):], dtype=np.float16
+            ).astype(np.float32)
+
+        if embedding_bytes[:len(EMBEDDING_BLOB_MAGIC_INT8)] == EMBEDDING_BLOB_MAGIC_INT8:
+            offset = len(EMBEDDING_BLOB_MAGIC_INT8)
+            scale = np.frombuffer(embedding_bytes, dtype=np.float32,
+                                  count=1, offset=offset)[0]
+            values = np.frombuffer(embedding_bytes, dtype=np.int8,
+                                   offset=offset + 4)
+            return values.astype(np.float32) * (scale / 127)
+
+        # Legacy pickle payload from before the raw float16 format
         return pickle.loads(embedding_bytes)
     
     def generate_weighted_embedding(self, texts: List[str], 
@@ -224,22 +526,28 @@ class EmbeddingGenerator:
             Weighted average embedding
         """
         if not texts:
-            return np.zeros(self.get_embedding_dimension())
-        
-        # Generate embeddings for all texts
-        embeddings = self.generate_embeddings(texts)
-        
+            return self._zero_vector()
+
+        # Generate embeddings for all texts; float32 keeps BLAS on the
+        # single-precision kernels
+        embeddings = np.asarray(self.generate_embeddings(texts), dtype=np.float32)
+
         # Set equal weights if not provided
         if weights is None:
             weights = [1.0 / len(texts)] * len(texts)
-        
-        # Normalize weights
-        weights = np.array(weights)
+
+        # Normalized weights times the matrix is one gemv, with no
+        # np.average temporaries
+        weights = np.asarray(weights, dtype=np.float32)
         weights = weights / weights.sum()
-        
-        # Compute weighted average
-        weighted_embedding = np.average(embeddings, axis=0, weights=weights)
-        
+        weighted_embedding = weights @ embeddings
+
+        # Inputs are unit vectors but their average is not; renormalize
+        # to keep the unit-length invariant
+        norm = np.linalg.norm(weighted_embedding)
+        if norm:
+            weighted_embedding = weighted_embedding / norm
+
         return weighted_embedding
     
     def embed_resume(self, resume_text: str, 
@@ -255,32 +563,101 @@ class EmbeddingGenerator:
         Returns:
             Resume embedding
         """
+        if not sections and not (resume_text and resume_text.strip()):
+            # Nothing to embed; match generate_embedding's empty-input
+            # contract without a transformer pass
+            return self._zero_vector()
+
         if sections:
-            # Generate weighted embedding based on sections
-            # Weight skills and experience more heavily
-            section_weights = {
-                'skills': 0.35,
-                'experience': 0.35,
-                'education': 0.15,
-                'projects': 0.10,
-                'other': 0.05
-            }
-            
-            texts = []
-            weights = []
-            
-            for section_name, section_text in sections.items():
-                if section_text and section_text.strip():
-                    texts.append(section_text)
-                    weight = section_weights.get(section_name.lower(), 0.05)
-                    weights.append(weight)
-            
+            texts, weights = self._section_texts_and_weights(sections)
             if texts:
                 return self.generate_weighted_embedding(texts, weights)
         
         # Fall back to simple embedding of full text
         return self.generate_embedding(resume_text)
     
+    def _section_texts_and_weights(self, sections: dict):
+        """
+        Collect non-empty section texts and their weights.
+
+        Args:
+            sections: Dict mapping section names to text
+
+        Returns:
+            Tuple of (texts, weights) lists, possibly empty
+        """
+        texts = []
+        weights = []
+
+        for section_name, section_text in sections.items():
+            if section_text and section_text.strip():
+                texts.append(section_text)
+                weights.append(
+                    self.SECTION_WEIGHTS.get(section_name.lower(), 0.05)
+                )
+
+        return texts, weights
+
+    def embed_resumes_batch(self, resume_texts: List[str],
+                            sections_list: List[dict] = None,
+                            batch_size: int = 128) -> np.ndarray:
+        """
+        Embed many resumes with one transformer pass over all sections.
+
+        Calling embed_resume per resume runs one encode per section
+        group; here every section text from every resume is flattened
+        into a single encode call, then the weighted per-resume averages
+        are re-aggregated from the shared matrix. Throughput is bounded
+        by the transformer, so one large batch beats N small ones.
+
+        Args:
+            resume_texts: Full text per resume
+            sections_list: Optional per-resume section dicts (same
+                          semantics as embed_resume); None entries fall
+                          back to the full text
+            batch_size: Encode batch size for the fused call
+
+        Returns:
+            Numpy array of shape (n_resumes, embedding_dim), unit rows
+        """
+        if not resume_texts:
+            return np.zeros((0, self.get_embedding_dimension()))
+
+        all_texts = []
+        owners = []
+        weights = []
+
+        for idx, resume_text in enumerate(resume_texts):
+            sections = sections_list[idx] if sections_list else None
+            texts, section_weights = (
+                self._section_texts_and_weights(sections) if sections
+                else ([], [])
+            )
+            if not texts:
+                texts, section_weights = [resume_text or ''], [1.0]
+
+            total = sum(section_weights)
+            for text, weight in zip(texts, section_weights):
+                all_texts.append(text)
+                owners.append(idx)
+                weights.append(weight / total)
+
+        embeddings = self.generate_embeddings(all_texts, batch_size=batch_size)
+
+        # Scatter-add each weighted segment row into its resume slot
+        owners = np.asarray(owners)
+        weights = np.asarray(weights, dtype=np.float32)
+        combined = np.zeros(
+            (len(resume_texts), embeddings.shape[1]), dtype=np.float32
+        )
+        np.add.at(combined, owners, embeddings * weights[:, None])
+
+        # Weighted averages of unit vectors need renormalizing
+        norms = np.linalg.norm(combined, axis=1, keepdims=True)
+        combined /= np.where(norms == 0, 1, norms)
+
+        return combined
+
     def embed_job_description(self, job_text: str,
                             requirements: str = None,
                             responsibilities: str = None) -> np.ndarray:
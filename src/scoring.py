@@ -3,6 +3,8 @@ Scoring and ranking module for Resume Screening System.
 Combines multiple scoring methods to rank candidates.
 """
 
+import heapq
+
 import numpy as np
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
@@ -42,6 +44,14 @@ class CandidateScorer:
         if not np.isclose(total_weight, 1.0):
             # Normalize weights
             self.weights = {k: v / total_weight for k, v in self.weights.items()}
+
+        # Component weights as a vector, so batch overall scores are a
+        # single (N, 3) @ (3,) product instead of N scalar combinations
+        self._weight_vec = np.array([
+            self.weights['skill_match'],
+            self.weights['semantic_similarity'],
+            self.weights['experience']
+        ], dtype=np.float32)
     
     def calculate_skill_match_score(self, resume_skills: List[str],
                                    job_skills: List[str]) -> Tuple[float, List[str]]:
@@ -49,33 +59,110 @@ class CandidateScorer:
         Calculate skill match score between resume and job requirements.
         
         Args:
-            resume_skills: Skills extracted from resume
-            job_skills: Required skills from job description
-            
+            resume_skills: Skills extracted from resume, as a list or an
+                          already-lowercased (frozen)set
+            job_skills: Required skills from job description, same forms
+
         Returns:
             Tuple of (score, matched_skills)
         """
         if not job_skills:
             return 1.0, []
-        
-        resume_set = set(skill.lower() for skill in resume_skills)
-        job_set = set(skill.lower() for skill in job_skills)
-        
+
+        # Frozensets from score_candidate's cache are already lowercased;
+        # only raw lists need the per-skill lower() pass
+        if isinstance(resume_skills, (set, frozenset)):
+            resume_set = resume_skills
+        else:
+            resume_set = set(skill.lower() for skill in resume_skills)
+        if isinstance(job_skills, (set, frozenset)):
+            job_set = job_skills
+        else:
+            job_set = set(skill.lower() for skill in job_skills)
+
         # Find matched skills
         matched = resume_set.intersection(job_set)
-        
-        # Calculate Jaccard similarity
-        union = resume_set.union(job_set)
-        jaccard_score = len(matched) / len(union) if union else 0.0
-        
+
+        # Jaccard similarity; the union size follows from the set sizes
+        # without materializing the union set
+        union_size = len(resume_set) + len(job_set) - len(matched)
+        jaccard_score = len(matched) / union_size if union_size else 0.0
+
         # Calculate coverage (what percentage of required skills are met)
         coverage_score = len(matched) / len(job_set) if job_set else 0.0
         
         # Combined score (weighted average favoring coverage)
         skill_score = 0.7 * coverage_score + 0.3 * jaccard_score
         
-        return skill_score, sorted(list(matched))
+        return skill_score, sorted(matched)
     
+    def calculate_skill_match_score_bits(self, resume_bits: bytes,
+                                        job_bits: bytes) -> Tuple[float, List[str]]:
+        """
+        Bitmask variant of calculate_skill_match_score.
+
+        Operates on the precomputed vocabulary bitmasks stored at insert
+        time, so no JSON parsing or set construction is needed. Skills
+        outside config.SKILL_BIT_ORDER are not represented in the masks.
+
+        Args:
+            resume_bits: Packed skill bitmask from the resume row, as
+                        the stored bytes or an already-unpacked int
+            job_bits: Packed skill bitmask from the job row, same forms
+
+        Returns:
+            Tuple of (score, matched_skills)
+        """
+        job_mask = (
+            job_bits if isinstance(job_bits, int)
+            else int.from_bytes(job_bits, 'little')
+        )
+        if not job_mask:
+            return 1.0, []
+
+        resume_mask = (
+            resume_bits if isinstance(resume_bits, int)
+            else int.from_bytes(resume_bits, 'little')
+        )
+        matched_mask = resume_mask & job_mask
+
+        matched_count = matched_mask.bit_count()
+        union_count = (resume_mask | job_mask).bit_count()
+
+        jaccard_score = matched_count / union_count if union_count else 0.0
+        coverage_score = matched_count / job_mask.bit_count()
+
+        skill_score = 0.7 * coverage_score + 0.3 * jaccard_score
+
+        # Decode matched bits back to skill names
+        matched = []
+        mask = matched_mask
+        while mask:
+            low_bit = mask & -mask
+            matched.append(config.SKILL_BIT_ORDER[low_bit.bit_length() - 1])
+            mask ^= low_bit
+
+        return skill_score, sorted(matched)
+
+    @staticmethod
+    def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+        """
+        Scale embeddings to unit length.
+
+        Once vectors are unit-normalized, cosine similarity is a plain
+        dot product, so pool-vs-job scoring collapses to one matrix
+        product with no per-pair norm recomputation.
+
+        Args:
+            embeddings: Single vector or matrix of row vectors
+
+        Returns:
+            Float32 array of the same shape with unit (or zero) rows
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        return embeddings / np.where(norms == 0, 1, norms)
+
     def calculate_semantic_similarity(self, resume_embedding: np.ndarray,
                                     job_embedding: np.ndarray) -> float:
         """
@@ -103,6 +190,105 @@ class CandidateScorer:
         
         return normalized_similarity
     
+    def calculate_semantic_similarity_batch(self, resume_embeddings: np.ndarray,
+                                            job_embedding: np.ndarray,
+                                            normalized: bool = False) -> np.ndarray:
+        """
+        Semantic similarity of a whole candidate pool in one BLAS call.
+
+        Equivalent to calling calculate_semantic_similarity per resume,
+        but the N dot products and norms collapse into one matrix-vector
+        product plus two vectorized norm computations, removing the
+        per-call NumPy dispatch overhead from ranking loops.
+
+        Args:
+            resume_embeddings: Matrix of shape (n_resumes, dim)
+            job_embedding: Job description embedding vector
+            normalized: True when the inputs are already unit vectors,
+                       skipping the normalization pass entirely
+
+        Returns:
+            Array of similarity scores (0 to 1), one per resume
+        """
+        resume_matrix = np.asarray(resume_embeddings, dtype=np.float32)
+        job_vector = np.asarray(job_embedding, dtype=np.float32).ravel()
+
+        if not normalized:
+            resume_matrix = self._l2_normalize(resume_matrix)
+            job_vector = self._l2_normalize(job_vector)
+
+        similarities = resume_matrix @ job_vector
+
+        # Normalize to 0-1 range, matching the scalar method. Zero rows
+        # stay zero through _l2_normalize, so their similarity maps to
+        # 0.5 here; mask them back to 0 as the scalar method does.
+        zero_rows = ~resume_matrix.any(axis=1)
+        scores = (similarities + 1) / 2
+        scores[zero_rows] = 0.0
+        if not job_vector.any():
+            scores[:] = 0.0
+        return scores
+
+    @staticmethod
+    def quantize_embeddings(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Symmetric per-row int8 quantization of unit-normalized embeddings.
+
+        A quantized pool is 4x smaller than float32, so large candidate
+        pools stay resident in cache during the similarity matmul. Round
+        trip error is ~1e-3 in cosine terms, well under ranking noise.
+
+        Args:
+            embeddings: Single vector or matrix of row vectors
+
+        Returns:
+            Tuple of (int8 array, float32 per-row scales) such that
+            quantized * scale / 127 approximates the unit vector
+        """
+        unit = CandidateScorer._l2_normalize(embeddings)
+        scales = np.max(np.abs(unit), axis=-1, keepdims=True).astype(np.float32)
+        safe_scales = np.where(scales == 0, 1, scales)
+        quantized = np.clip(
+            np.rint(unit / safe_scales * 127.0), -127, 127
+        ).astype(np.int8)
+        return quantized, scales
+
+    def calculate_semantic_similarity_batch_int8(self, resume_quantized: np.ndarray,
+                                                 resume_scales: np.ndarray,
+                                                 job_quantized: np.ndarray,
+                                                 job_scale: float) -> np.ndarray:
+        """
+        Batched semantic similarity over int8-quantized embeddings.
+
+        The dot products run as one integer matrix-vector product
+        (widened to int32 so the accumulation cannot overflow), then the
+        per-row scales map the results back to cosine space. Inputs come
+        from quantize_embeddings.
+
+        Args:
+            resume_quantized: int8 matrix of shape (n_resumes, dim)
+            resume_scales: Per-row scales from quantize_embeddings
+            job_quantized: int8 job embedding vector
+            job_scale: Scale of the job embedding (scalar or the
+                      one-element array quantize_embeddings returns)
+
+        Returns:
+            Array of similarity scores (0 to 1), one per resume
+        """
+        dots = resume_quantized.astype(np.int32) @ job_quantized.astype(np.int32)
+
+        scales = np.asarray(resume_scales, dtype=np.float32).ravel()
+        job_scale = float(np.asarray(job_scale).ravel()[0])
+        similarities = dots.astype(np.float32) * scales * job_scale / (127.0 * 127.0)
+        similarities = np.clip(similarities, -1.0, 1.0)
+
+        # Zero vectors quantize to all-zero rows; keep them scoring 0
+        scores = (similarities + 1) / 2
+        scores[~resume_quantized.any(axis=1)] = 0.0
+        if not job_quantized.any():
+            scores[:] = 0.0
+        return scores
+
     def calculate_experience_score(self, candidate_years: float,
                                   required_years: float = None,
                                   max_years: float = 20.0) -> float:
@@ -153,26 +339,53 @@ class CandidateScorer:
         
         return overall
     
-    def score_candidate(self, 
+    def score_all(self, component_scores: np.ndarray) -> np.ndarray:
+        """
+        Weighted overall scores for a whole pool in one matrix product.
+
+        Args:
+            component_scores: Array of shape (n_candidates, 3) with
+                             columns (skill, semantic, experience),
+                             matching the weight order in __init__
+
+        Returns:
+            Array of overall scores, one per candidate
+        """
+        return np.asarray(component_scores, dtype=np.float32) @ self._weight_vec
+
+    def score_candidate(self,
                        resume_data: Dict,
                        job_data: Dict,
-                       resume_embedding: np.ndarray,
-                       job_embedding: np.ndarray) -> ScoringComponents:
+                       resume_embedding: np.ndarray = None,
+                       job_embedding: np.ndarray = None,
+                       semantic_similarity: float = None) -> ScoringComponents:
         """
         Calculate all scoring components for a candidate.
-        
+
         Args:
             resume_data: Resume information dictionary
             job_data: Job description information dictionary
             resume_embedding: Resume embedding vector
             job_embedding: Job embedding vector
-            
+            semantic_similarity: Precomputed raw cosine similarity
+                                (e.g. from a batched matrix product).
+                                When provided, the embedding vectors are
+                                not needed and no dot product is computed.
+                                Pass NaN for a zero embedding; it scores
+                                0.0 like the scalar similarity method.
+
         Returns:
             ScoringComponents object with all scores
         """
-        # Extract data
-        resume_skills = resume_data.get('extracted_skills', [])
-        job_skills = job_data.get('required_skills', [])
+        # Extract data. Lowercased skill sets are cached on the input
+        # dicts so re-scoring the same resume (or job) against many
+        # counterparts builds each set once instead of once per pair.
+        resume_skills = resume_data.setdefault('_skill_set', frozenset(
+            skill.lower() for skill in resume_data.get('extracted_skills', [])
+        ))
+        job_skills = job_data.setdefault('_skill_set', frozenset(
+            skill.lower() for skill in job_data.get('required_skills', [])
+        ))
         candidate_years = resume_data.get('experience_years', 0.0)
         required_years = job_data.get('required_experience_years', None)
         
@@ -181,9 +394,19 @@ class CandidateScorer:
             resume_skills, job_skills
         )
         
-        semantic_score = self.calculate_semantic_similarity(
-            resume_embedding, job_embedding
-        )
+        if semantic_similarity is not None:
+            # Normalize the precomputed cosine similarity to 0-1 range,
+            # matching calculate_semantic_similarity. Callers flag zero
+            # embeddings with NaN (their cosine is undefined); the
+            # scalar method scores those 0.0, so this path must too
+            if np.isnan(semantic_similarity):
+                semantic_score = 0.0
+            else:
+                semantic_score = (semantic_similarity + 1) / 2
+        else:
+            semantic_score = self.calculate_semantic_similarity(
+                resume_embedding, job_embedding
+            )
         
         experience_score = self.calculate_experience_score(
             candidate_years, required_years
@@ -202,6 +425,90 @@ class CandidateScorer:
             matched_skills=matched_skills
         )
     
+    def score_candidates_batch(self,
+                              resume_skill_lists: List[List[str]],
+                              experience_years: np.ndarray,
+                              similarities: np.ndarray,
+                              job_skills: List[str],
+                              resume_skill_bits: List[bytes] = None,
+                              job_skill_bits: bytes = None,
+                              required_years: float = None) -> List[ScoringComponents]:
+        """
+        Score a whole candidate pool from structure-of-arrays inputs.
+
+        The semantic, experience, and overall components are computed as
+        single NumPy expressions over the full pool; only matched-skill
+        name resolution runs per candidate. When precomputed skill
+        bitmasks are provided, the skill component uses them directly and
+        resume_skill_lists may be None.
+
+        Args:
+            resume_skill_lists: Extracted skills per candidate
+            experience_years: Years of experience per candidate
+            similarities: Raw cosine similarity per candidate; NaN
+                         marks a zero embedding and scores 0.0
+            job_skills: Required skills from the job description
+            resume_skill_bits: Optional packed skill bitmask per candidate
+            job_skill_bits: Optional packed bitmask of the job skills
+            required_years: Required years of experience, if the job
+                           specifies one
+
+        Returns:
+            List of ScoringComponents, one per candidate
+        """
+        similarities = np.asarray(similarities, dtype=np.float32)
+        experience_years = np.asarray(experience_years, dtype=np.float32)
+
+        # Vectorized semantic and experience components; the experience
+        # branch mirrors calculate_experience_score across the pool.
+        # NaN similarities flag zero embeddings (undefined cosine) and
+        # score 0.0, matching calculate_semantic_similarity's guard
+        semantic_scores = (similarities + 1) / 2
+        semantic_scores[np.isnan(semantic_scores)] = 0.0
+        if required_years is None:
+            experience_scores = np.minimum(experience_years / 20.0, 1.0)
+        elif required_years <= 0:
+            experience_scores = np.ones_like(experience_years)
+        else:
+            experience_scores = np.where(
+                experience_years >= required_years,
+                1.0, experience_years / required_years
+            ).astype(np.float32)
+
+        # Skill matching needs the matched names, so it stays per candidate
+        use_bits = resume_skill_bits is not None and job_skill_bits is not None
+        pool_size = len(resume_skill_bits if use_bits else resume_skill_lists)
+
+        skill_scores = np.empty(pool_size, dtype=np.float32)
+        matched_lists = []
+        for i in range(pool_size):
+            if use_bits:
+                skill_score, matched = self.calculate_skill_match_score_bits(
+                    resume_skill_bits[i], job_skill_bits
+                )
+            else:
+                skill_score, matched = self.calculate_skill_match_score(
+                    resume_skill_lists[i], job_skills
+                )
+            skill_scores[i] = skill_score
+            matched_lists.append(matched)
+
+        # Weighted overall score for the whole pool in one matrix product
+        overall_scores = self.score_all(
+            np.column_stack([skill_scores, semantic_scores, experience_scores])
+        )
+
+        return [
+            ScoringComponents(
+                skill_match_score=float(skill_scores[i]),
+                semantic_similarity_score=float(semantic_scores[i]),
+                experience_score=float(experience_scores[i]),
+                overall_score=float(overall_scores[i]),
+                matched_skills=matched_lists[i]
+            )
+            for i in range(len(matched_lists))
+        ]
+
     def rank_candidates(self, scoring_results: List[Dict]) -> List[Dict]:
         """
         Rank candidates by overall score and assign ranks.
@@ -212,17 +519,21 @@ class CandidateScorer:
         Returns:
             Sorted list with rank assignments
         """
-        # Sort by overall score (descending)
-        sorted_results = sorted(
-            scoring_results,
-            key=lambda x: x['overall_score'],
-            reverse=True
+        # Sort by overall score (descending) via argsort over a plain
+        # float array: no Python key callback per comparison. The stable
+        # kind keeps insertion order among ties, matching sorted()
+        scores = np.fromiter(
+            (result['overall_score'] for result in scoring_results),
+            dtype=np.float32, count=len(scoring_results)
         )
-        
+        order = np.argsort(-scores, kind='stable')
+
+        sorted_results = [scoring_results[i] for i in order]
+
         # Assign ranks
         for rank, result in enumerate(sorted_results, start=1):
             result['rank'] = rank
-        
+
         return sorted_results
     
     def filter_by_threshold(self, scored_candidates: List[Dict],
@@ -254,16 +565,13 @@ class CandidateScorer:
             k: Number of top candidates to return
             
         Returns:
-            Top K candidates
+            Top K candidates, best first
         """
-        # Sort by overall score
-        sorted_candidates = sorted(
-            scored_candidates,
-            key=lambda x: x.get('overall_score', 0),
-            reverse=True
+        # Heap selection is O(N log k) vs O(N log N) for a full sort,
+        # and k is typically far smaller than the candidate pool
+        return heapq.nlargest(
+            k, scored_candidates, key=lambda x: x.get('overall_score', 0)
         )
-        
-        return sorted_candidates[:k]
     
     def generate_ranking_explanation(self, scoring: ScoringComponents) -> str:
         """
@@ -3,18 +3,203 @@ Skill extraction module for Resume Screening System.
 Combines keyword matching with NLP-based entity recognition.
 """
 
+import pickle
 import re
+import sys
 from typing import List, Set, Dict, Tuple
-from config import SKILL_KEYWORDS
+from config import SKILL_KEYWORDS, SKILL_INDEX_PATH
 from src.preprocessing import TextPreprocessor
 
 # Import spaCy only when needed to avoid compatibility issues
 try:
     import spacy
+    from spacy.matcher import PhraseMatcher
     SPACY_AVAILABLE = True
 except Exception:
     SPACY_AVAILABLE = False
     spacy = None
+    PhraseMatcher = None
+
+# pyahocorasick is an optional accelerator for keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except Exception:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Normalized default vocabulary, built once and shared by reference:
+# extractors without custom skills all point at this one frozenset
+# instead of holding per-instance copies. Entries are interned so
+# every matched skill resolves to one canonical string object and
+# hash-table probes can short-circuit on identity
+_DEFAULT_KEYWORDS = frozenset(
+    sys.intern(skill.lower().strip()) for skill in SKILL_KEYWORDS
+)
+
+# Automaton over the default vocabulary, built once and shared by every
+# extractor without custom skills (building walks the whole trie)
+_DEFAULT_AUTOMATON = None
+
+# Version tag for the prebuilt index written by build_skill_index.py;
+# bump when the automaton payload layout changes
+SKILL_INDEX_FORMAT = 1
+
+
+def _build_skill_automaton(skill_keywords):
+    """Build an Aho-Corasick automaton over a skill keyword set."""
+    automaton = ahocorasick.Automaton()
+    for skill in skill_keywords:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+# Extraction patterns, compiled once at import instead of per call.
+# Skills-section headers capture everything up to the next period; the
+# six header forms are one alternation so a document is scanned once
+_SECTION_PATTERN = re.compile(
+    r'(?:'
+    r'(?:technical\s+)?skills?(?:\s+and\s+technologies)?'
+    r'|(?:core\s+)?competencies'
+    r'|technologies'
+    r'|expertise'
+    r'|proficient\s+in'
+    r'|experienced\s+(?:in|with)'
+    r')[:\s]+([^\.]+)',
+    re.IGNORECASE
+)
+
+# Phrases that introduce a skill in running prose
+_CONTEXT_PATTERNS = [
+    re.compile(pattern)
+    for pattern in (
+        r'(?:proficient|skilled|experienced|expert)\s+(?:in|with)\s+([^,\.]+)',
+        r'(?:knowledge|understanding)\s+of\s+([^,\.]+)',
+        r'(?:working\s+)?(?:experience|exposure)\s+(?:with|in)\s+([^,\.]+)',
+        r'strong\s+(?:background|foundation)\s+in\s+([^,\.]+)',
+        r'hands-on\s+(?:experience\s+)?(?:with|in)\s+([^,\.]+)',
+    )
+]
+
+# Job-description section headers for requirement classification
+_REQUIRED_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:required|must\s+have|mandatory|essential)[:\s]+([^\.]+)',
+        r'requirements?[:\s]+([^\.]+)',
+    )
+]
+_PREFERRED_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:preferred|nice\s+to\s+have|bonus|desired)[:\s]+([^\.]+)',
+        r'(?:plus|advantage)[:\s]+([^\.]+)',
+    )
+]
+
+# Section contents split on delimiters by folding them all to newline
+# with one C-level translate, then a plain str.split
+_DELIM_TABLE = str.maketrans({char: '\n' for char in ',;|\u2022\t'})
+
+# Delimiter-plus-whitespace split for context-match tokens
+_TOKEN_SPLIT = re.compile(r'[,;|\u2022\n\t\s]+')
+
+# Surface forms of the context-pattern triggers above, enumerated so a
+# single automaton pass can locate all of them at once
+_TRIGGER_PHRASES = tuple(
+    f'{head} {tail}'
+    for head in ('proficient', 'skilled', 'experienced', 'expert')
+    for tail in ('in', 'with')
+) + (
+    'knowledge of', 'understanding of',
+    'experience with', 'experience in',
+    'exposure with', 'exposure in',
+    'strong background in', 'strong foundation in',
+    'hands-on with', 'hands-on in',
+)
+
+_TRIGGER_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _TRIGGER_AUTOMATON = ahocorasick.Automaton()
+    for _phrase in _TRIGGER_PHRASES:
+        _TRIGGER_AUTOMATON.add_word(_phrase, _phrase)
+    _TRIGGER_AUTOMATON.make_automaton()
+
+
+def _build_scan_automaton(skill_keywords):
+    """Build one automaton covering skills and context triggers.
+
+    Payloads are tagged so a single pass over the text serves both the
+    keyword and the contextual-pattern extraction methods.
+    """
+    automaton = ahocorasick.Automaton()
+    for skill in skill_keywords:
+        automaton.add_word(skill, ('s', skill))
+    for phrase in _TRIGGER_PHRASES:
+        automaton.add_word(phrase, ('t', phrase))
+    automaton.make_automaton()
+    return automaton
+
+
+# Combined scanner over the default vocabulary, shared like the plain
+# skill automaton above
+_DEFAULT_SCAN_AUTOMATON = None
+
+
+def _load_prebuilt_index():
+    """Load the automatons pickled by build_skill_index.py, if valid.
+
+    The index is only trusted when its format tag and stored keyword
+    list match this process's configuration, so edits to
+    SKILL_KEYWORDS transparently fall back to an in-process build.
+
+    Returns:
+        Tuple of (skill automaton, scan automaton), or None when the
+        index is absent, stale or unreadable
+    """
+    try:
+        with open(SKILL_INDEX_PATH, 'rb') as f:
+            payload = pickle.load(f)
+        if (payload.get('format') == SKILL_INDEX_FORMAT
+                and payload.get('keywords') == sorted(_DEFAULT_KEYWORDS)):
+            return payload['skill_automaton'], payload['scan_automaton']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+        pass
+    return None
+
+# Category vocabularies, frozen at module scope, flattened into a
+# single skill -> category lookup so categorization is one dict probe
+# per skill instead of up to six set membership tests
+_CATEGORY_SETS = {
+    'programming_languages': frozenset({
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#',
+        'ruby', 'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r'
+    }),
+    'frameworks': frozenset({
+        'react', 'angular', 'vue', 'django', 'flask', 'spring',
+        'nodejs', 'express', 'tensorflow', 'pytorch', 'keras'
+    }),
+    'databases': frozenset({
+        'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra',
+        'oracle', 'sqlite', 'dynamodb', 'elasticsearch'
+    }),
+    'cloud': frozenset({
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible'
+    }),
+    'tools': frozenset({
+        'git', 'github', 'gitlab', 'jenkins', 'ci/cd', 'linux', 'unix'
+    }),
+    'soft_skills': frozenset({
+        'leadership', 'communication', 'teamwork', 'problem solving',
+        'critical thinking', 'project management', 'agile', 'scrum'
+    }),
+}
+_SKILL_TO_CATEGORY = {
+    skill: category
+    for category, skills in _CATEGORY_SETS.items()
+    for skill in skills
+}
 
 
 class SkillExtractor:
@@ -33,102 +218,305 @@ class SkillExtractor:
             custom_skills: Additional skill keywords to include
             use_spacy: Whether to use spaCy for NLP-based extraction
         """
-        # Combine default and custom skills
-        self.skill_keywords = SKILL_KEYWORDS.copy()
+        # Combine default and custom skills, normalized and frozen so
+        # membership tests hit a fixed hash table that can never be
+        # mutated mid-extraction; without custom skills every instance
+        # shares the module-level default set
         if custom_skills:
-            self.skill_keywords.update(custom_skills)
-        
-        # Normalize all skill keywords
-        self.skill_keywords = {skill.lower().strip() for skill in self.skill_keywords}
-        
-        # Initialize preprocessor
+            self.skill_keywords = _DEFAULT_KEYWORDS | frozenset(
+                sys.intern(skill.lower().strip()) for skill in custom_skills
+            )
+        else:
+            self.skill_keywords = _DEFAULT_KEYWORDS
+        
+        # Initialize preprocessor; its lazily-loaded pipeline is shared
+        # below so extractor and preprocessor never parse twice
         self.preprocessor = TextPreprocessor(use_spacy=use_spacy)
-        self.use_spacy = use_spacy
-        
-        # Load spaCy model if available
-        if use_spacy and SPACY_AVAILABLE:
-            try:
-                self.nlp = spacy.load('en_core_web_sm')
-            except (OSError, Exception) as e:
-                print(f"Warning: spaCy not available ({e}). Using keyword matching only.")
-                self.use_spacy = False
-        elif use_spacy and not SPACY_AVAILABLE:
-            print("Warning: spaCy not available. Using keyword matching only.")
-            self.use_spacy = False
+        self.use_spacy = self.preprocessor.use_spacy
         
         # Compile regex patterns for common skill formats
         self._compile_patterns()
+
+        # PhraseMatcher over the skill vocabulary, built on first NLP
+        # extraction (needs the pipeline's vocab)
+        self._matcher = None
+
+        # Tokenizer-only spaCy pipeline for vocabulary matching; the
+        # full statistical model is only loaded for the legacy
+        # entity/noun-chunk fallback
+        self._blank_nlp = None
+
+        # Memoized extraction results: screening scores the same resume
+        # against many jobs, and the four-method pipeline is pure in
+        # its input text, so repeats become one dict lookup
+        self._extraction_cache = {}
+
+    @property
+    def _skill_regex(self):
+        """Fallback matcher when pyahocorasick is missing: one
+        alternation over the whole vocabulary (longest first, so the
+        engine need not backtrack through prefixes like
+        java/javascript), scanned in a single findall instead of one
+        re.search per skill. Compiled on first use, so automaton-backed
+        extractors never pay for it."""
+        if self._skill_regex_compiled is None:
+            # Plain \b fails at non-word edges ('c++ ' has no boundary
+            # after '+'), so each branch guards only its word-character
+            # edges, matching the automaton's boundary rule
+            branches = []
+            for skill in sorted(self.skill_keywords, key=len, reverse=True):
+                prefix = r'(?<!\w)' if (skill[0].isalnum() or skill[0] == '_') else ''
+                suffix = r'(?!\w)' if (skill[-1].isalnum() or skill[-1] == '_') else ''
+                branches.append(prefix + re.escape(skill) + suffix)
+            self._skill_regex_compiled = re.compile('|'.join(branches))
+        return self._skill_regex_compiled
+
+    @property
+    def nlp(self):
+        """The preprocessor's spaCy pipeline (or None): one model load
+        and one vocabulary shared per extractor."""
+        return self.preprocessor.nlp if self.use_spacy else None
+
+    @property
+    def blank_nlp(self):
+        """Tokenizer-only pipeline for PhraseMatcher extraction.
+
+        Vocabulary matching only needs token boundaries, so a blank
+        English pipeline replaces en_core_web_sm here: no model
+        download, near-instant load, and tokenization without tagger,
+        parser or NER forward passes. Built on first use; None when
+        spaCy is unavailable.
+        """
+        if self._blank_nlp is None and self.use_spacy and spacy is not None:
+            self._blank_nlp = spacy.blank('en')
+        return self._blank_nlp
     
     def _compile_patterns(self):
-        """Compile regex patterns for skill extraction."""
-        # Pattern for skills sections
-        self.section_patterns = [
-            r'(?:technical\s+)?skills?(?:\s+and\s+technologies)?[:\s]+([^\.]+)',
-            r'(?:core\s+)?competencies[:\s]+([^\.]+)',
-            r'technologies[:\s]+([^\.]+)',
-            r'expertise[:\s]+([^\.]+)',
-            r'proficient\s+in[:\s]+([^\.]+)',
-            r'experienced\s+(?:in|with)[:\s]+([^\.]+)',
-        ]
-        
-        # Compile patterns
-        self.compiled_patterns = [
-            re.compile(pattern, re.IGNORECASE) 
-            for pattern in self.section_patterns
-        ]
+        """Set up the keyword matchers for skill extraction."""
+        self._skill_regex_compiled = None
+
+        # Build a single Aho-Corasick automaton over the skill keywords so
+        # each document is scanned once instead of once per skill; the
+        # default-vocabulary automaton is cached at module level
+        self.skill_automaton = None
+        self.scan_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            global _DEFAULT_AUTOMATON, _DEFAULT_SCAN_AUTOMATON
+            if self.skill_keywords is _DEFAULT_KEYWORDS:
+                if _DEFAULT_AUTOMATON is None:
+                    # Prefer the index prebuilt by build_skill_index.py;
+                    # construct the tries here only when it is missing
+                    # or out of step with the configured vocabulary
+                    prebuilt = _load_prebuilt_index()
+                    if prebuilt is not None:
+                        _DEFAULT_AUTOMATON, _DEFAULT_SCAN_AUTOMATON = prebuilt
+                    else:
+                        _DEFAULT_AUTOMATON = _build_skill_automaton(self.skill_keywords)
+                        _DEFAULT_SCAN_AUTOMATON = _build_scan_automaton(self.skill_keywords)
+                self.skill_automaton = _DEFAULT_AUTOMATON
+                self.scan_automaton = _DEFAULT_SCAN_AUTOMATON
+            else:
+                self.skill_automaton = _build_skill_automaton(self.skill_keywords)
+                self.scan_automaton = _build_scan_automaton(self.skill_keywords)
     
-    def extract_from_text(self, text: str) -> List[str]:
+    def extract_from_text(self, text: str, doc=None) -> List[str]:
         """
         Extract skills from text using multiple methods.
         
         Args:
             text: Input text (resume or job description)
+            doc: spaCy Doc for the text, if the caller already parsed
+                it (skips the duplicate pipeline pass)
             
         Returns:
             List of extracted skills
         """
+        cached = self._extraction_cache.get(text)
+        if cached is not None:
+            return list(cached)
+
         skills = set()
-        
-        # Method 1: Keyword matching
-        skills.update(self._extract_by_keywords(text))
-        
+
+        # One lowercased copy shared by every regex/keyword method;
+        # only the NLP pass needs the original casing for NER
+        text_lower = text.lower()
+
+        if self.scan_automaton is not None:
+            # Methods 1 and 4 fused: one automaton pass locates both
+            # skill occurrences and context triggers
+            skills.update(self._scan_once(text_lower))
+        else:
+            # Method 1: Keyword matching
+            skills.update(self._extract_by_keywords(text, text_lower=text_lower))
+
+            # Method 4: Pattern-based extraction
+            skills.update(self._extract_by_patterns(text, text_lower=text_lower))
+
         # Method 2: Section-based extraction
-        skills.update(self._extract_from_sections(text))
+        skills.update(self._extract_from_sections(text_lower))
         
         # Method 3: NLP-based extraction (if spaCy is available)
         if self.use_spacy:
-            skills.update(self._extract_by_nlp(text))
-        
-        # Method 4: Pattern-based extraction
-        skills.update(self._extract_by_patterns(text))
-        
-        return sorted(list(skills))
+            skills.update(self._extract_by_nlp(text, doc=doc))
+
+        result = sorted(skills)
+
+        # Bounded cache: drop the oldest entry once full (dicts keep
+        # insertion order, so the first key is the oldest)
+        if len(self._extraction_cache) >= 2048:
+            self._extraction_cache.pop(next(iter(self._extraction_cache)))
+        self._extraction_cache[text] = tuple(result)
+
+        return result
+
+    def invalidate_cache(self):
+        """Clear memoized extraction results."""
+        self._extraction_cache.clear()
+
+    def _scan_once(self, text_lower: str) -> Set[str]:
+        """
+        Keyword and contextual extraction in one automaton pass.
+
+        Equivalent to the union of _extract_by_keywords and
+        _extract_by_patterns, but the text is walked once: tagged
+        payloads distinguish skill hits (boundary-checked) from
+        trigger phrases (whose following clause is token-checked).
+
+        Args:
+            text_lower: Lowercased input text
+
+        Returns:
+            Set of matched skills
+        """
+        skills = set()
+
+        for end_index, (kind, value) in self.scan_automaton.iter(text_lower):
+            if kind == 's':
+                if value in skills:
+                    continue
+                start_index = end_index - len(value) + 1
+                prev_char = text_lower[start_index - 1] if start_index > 0 else ''
+                next_char = (
+                    text_lower[end_index + 1]
+                    if end_index + 1 < len(text_lower) else ''
+                )
+                if not (self._is_word_char(value[0]) and self._is_word_char(prev_char)) \
+                        and not (self._is_word_char(value[-1]) and self._is_word_char(next_char)):
+                    skills.add(value)
+            else:
+                clause = self._clause_after(text_lower, end_index + 1)
+                for token in _TOKEN_SPLIT.split(clause):
+                    if len(token) > 2 and token in self.skill_keywords:
+                        skills.add(sys.intern(token))
+
+        return skills
     
-    def _extract_by_keywords(self, text: str) -> Set[str]:
+    def extract_from_texts(self, texts: List[str],
+                           batch_size: int = 64,
+                           n_process: int = 1) -> List[List[str]]:
+        """
+        Extract skills from many texts in one call.
+
+        With spaCy active the documents stream through nlp.pipe, which
+        batches tokenization and model forward passes instead of paying
+        the per-call pipeline overhead once per text; the regex and
+        keyword extractors then reuse each parsed Doc. Pass n_process
+        > 1 (or -1 for all cores) to tokenize across worker processes
+        for large batches.
+
+        Args:
+            texts: Input texts (resumes or job descriptions)
+            batch_size: Documents per pipeline batch
+            n_process: Worker processes for the spaCy pipeline
+
+        Returns:
+            One extracted-skill list per input text, in order
+        """
+        if self._get_matcher() is not None:
+            # Tokenizer-only pipeline: no model components to batch,
+            # but pipe still amortizes per-call overhead
+            docs = self.blank_nlp.pipe(texts, batch_size=batch_size,
+                                       n_process=n_process)
+            return [
+                self.extract_from_text(text, doc=doc)
+                for text, doc in zip(texts, docs)
+            ]
+
+        nlp = self.nlp
+        if self.use_spacy and nlp is not None:
+            docs = nlp.pipe(texts, batch_size=batch_size,
+                            n_process=n_process)
+            return [
+                self.extract_from_text(text, doc=doc)
+                for text, doc in zip(texts, docs)
+            ]
+
+        return [self.extract_from_text(text) for text in texts]
+
+    def _extract_by_keywords(self, text: str,
+                             text_lower: str = None) -> Set[str]:
         """
         Extract skills by matching against keyword database.
         
         Args:
             text: Input text
+            text_lower: Lowercased text, if the caller already has it
             
         Returns:
             Set of matched skills
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        if not text_lower:
+            return set()
+
+        if self.skill_automaton is not None:
+            return self._match_keywords_automaton(text_lower)
+
+        return set(self._skill_regex.findall(text_lower))
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Check whether a character counts as a regex word character."""
+        return char.isalnum() or char == '_'
+
+    def _match_keywords_automaton(self, text_lower: str) -> Set[str]:
+        """
+        Match skill keywords in a single Aho-Corasick pass.
+
+        Args:
+            text_lower: Lowercased input text
+
+        Returns:
+            Set of matched skills
+        """
         matched_skills = set()
-        
-        for skill in self.skill_keywords:
-            # Use word boundaries for accurate matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
+
+        for end_index, skill in self.skill_automaton.iter(text_lower):
+            if skill in matched_skills:
+                continue
+
+            start_index = end_index - len(skill) + 1
+            prev_char = text_lower[start_index - 1] if start_index > 0 else ''
+            next_char = text_lower[end_index + 1] if end_index + 1 < len(text_lower) else ''
+
+            # A word-character edge must not extend into a neighboring
+            # word character; non-word edges (the '+' of c++, the '#'
+            # of c#) need no guard, unlike regex \b which would reject
+            # them outright
+            if not (self._is_word_char(skill[0]) and self._is_word_char(prev_char)) \
+                    and not (self._is_word_char(skill[-1]) and self._is_word_char(next_char)):
                 matched_skills.add(skill)
-        
+
         return matched_skills
     
     def _extract_from_sections(self, text: str) -> Set[str]:
         """
         Extract skills from dedicated skills sections.
-        
+
+        The section patterns are case-insensitive, so callers may pass
+        either the raw or an already-lowercased text.
+
         Args:
             text: Input text
             
@@ -137,39 +525,56 @@ class SkillExtractor:
         """
         skills = set()
         
-        for pattern in self.compiled_patterns:
-            matches = pattern.findall(text)
-            for match in matches:
-                # Split by common delimiters
-                skill_list = re.split(r'[,;|•\n\t]', match)
-                for skill in skill_list:
-                    skill = skill.strip().lower()
-                    # Check if extracted skill is in our database
-                    if skill in self.skill_keywords:
-                        skills.add(skill)
-                    # Also check individual words
-                    for word in skill.split():
-                        word = word.strip()
-                        if word in self.skill_keywords and len(word) > 2:
-                            skills.add(word)
+        for match in _SECTION_PATTERN.findall(text):
+            # Fold every delimiter to newline in one translate pass,
+            # then split without the regex engine
+            for skill in match.translate(_DELIM_TABLE).split('\n'):
+                skill = skill.strip().lower()
+                # Check if extracted skill is in our database
+                if skill in self.skill_keywords:
+                    # A hit means the vocabulary holds an interned
+                    # equal, so this stores the canonical object
+                    skills.add(sys.intern(skill))
+                # Also check individual words
+                for word in skill.split():
+                    word = word.strip()
+                    if word in self.skill_keywords and len(word) > 2:
+                        skills.add(sys.intern(word))
         
         return skills
     
-    def _extract_by_nlp(self, text: str) -> Set[str]:
+    def _extract_by_nlp(self, text: str, doc=None) -> Set[str]:
         """
         Extract skills using NLP techniques (entity recognition, noun phrases).
         
         Args:
             text: Input text
+            doc: Already-parsed spaCy Doc, if the caller has one
             
         Returns:
             Set of extracted skills
         """
-        if not self.use_spacy:
+        # Vocabulary matching runs in spaCy's C-level PhraseMatcher,
+        # replacing the Python loops over entities and noun chunks;
+        # fresh parses go through the blank tokenizer-only pipeline,
+        # so no statistical component ever runs on this path
+        matcher = self._get_matcher()
+        if matcher is not None:
+            if doc is None:
+                doc = self.blank_nlp(text)
+            return {
+                doc[start:end].text.lower().strip()
+                for _, start, end in matcher(doc)
+            }
+
+        nlp = self.nlp
+        if doc is None and nlp is None:
             return set()
-        
+
+        if doc is None:
+            doc = nlp(text)
+
         skills = set()
-        doc = self.nlp(text)
         
         # Extract from named entities
         for ent in doc.ents:
@@ -189,40 +594,72 @@ class SkillExtractor:
                     skills.add(token_text)
         
         return skills
+
+    def _get_matcher(self):
+        """
+        The PhraseMatcher over the skill vocabulary, built on first use.
+
+        Returns:
+            PhraseMatcher bound to the blank pipeline's vocab, or None
+            when spaCy is unavailable
+        """
+        if self._matcher is None and PhraseMatcher is not None:
+            nlp = self.blank_nlp
+            if nlp is None:
+                return None
+            matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+            matcher.add('SKILLS', [
+                nlp.make_doc(skill) for skill in self.skill_keywords
+            ])
+            self._matcher = matcher
+        return self._matcher
     
-    def _extract_by_patterns(self, text: str) -> Set[str]:
+    def _extract_by_patterns(self, text: str,
+                             text_lower: str = None) -> Set[str]:
         """
         Extract skills using contextual patterns.
         
         Args:
             text: Input text
+            text_lower: Lowercased text, if the caller already has it
             
         Returns:
             Set of extracted skills
         """
         skills = set()
-        text_lower = text.lower()
-        
-        # Common patterns indicating skills
-        context_patterns = [
-            r'(?:proficient|skilled|experienced|expert)\s+(?:in|with)\s+([^,\.]+)',
-            r'(?:knowledge|understanding)\s+of\s+([^,\.]+)',
-            r'(?:working\s+)?(?:experience|exposure)\s+(?:with|in)\s+([^,\.]+)',
-            r'strong\s+(?:background|foundation)\s+in\s+([^,\.]+)',
-            r'hands-on\s+(?:experience\s+)?(?:with|in)\s+([^,\.]+)',
-        ]
-        
-        for pattern in context_patterns:
-            matches = re.findall(pattern, text_lower)
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Single automaton pass over the trigger phrases; each hit
+        # examines the clause up to the next comma or period, mirroring
+        # the [^,.]+ capture of the regex patterns
+        if _TRIGGER_AUTOMATON is not None:
+            for end_index, _ in _TRIGGER_AUTOMATON.iter(text_lower):
+                clause = self._clause_after(text_lower, end_index + 1)
+                for token in _TOKEN_SPLIT.split(clause):
+                    if len(token) > 2 and token in self.skill_keywords:
+                        skills.add(sys.intern(token))
+            return skills
+
+        for pattern in _CONTEXT_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 # Extract potential skills from the matched text
-                tokens = re.split(r'[,;|•\n\t\s]+', match)
+                tokens = _TOKEN_SPLIT.split(match)
                 for token in tokens:
                     token = token.strip()
                     if token in self.skill_keywords and len(token) > 2:
-                        skills.add(token)
+                        skills.add(sys.intern(token))
         
         return skills
+
+    @staticmethod
+    def _clause_after(text_lower: str, start: int) -> str:
+        """The span from start up to the next comma or period."""
+        comma = text_lower.find(',', start)
+        period = text_lower.find('.', start)
+        stops = [index for index in (comma, period) if index != -1]
+        return text_lower[start:min(stops)] if stops else text_lower[start:]
     
     def calculate_skill_match(self, resume_skills: List[str], 
                             job_skills: List[str]) -> Tuple[float, List[str]]:
@@ -230,25 +667,34 @@ class SkillExtractor:
         Calculate skill match score between resume and job description.
         
         Args:
-            resume_skills: Skills extracted from resume
-            job_skills: Skills required for job
+            resume_skills: Skills extracted from resume, as a list or
+                          an already-lowercased (frozen)set
+            job_skills: Skills required for job, same forms
             
         Returns:
             Tuple of (match_score, matched_skills)
         """
         if not job_skills:
             return 0.0, []
-        
-        resume_set = set(skill.lower() for skill in resume_skills)
-        job_set = set(skill.lower() for skill in job_skills)
-        
+
+        # Callers ranking one resume against many jobs can pass cached
+        # frozensets and skip the per-comparison rebuild
+        if isinstance(resume_skills, (set, frozenset)):
+            resume_set = resume_skills
+        else:
+            resume_set = set(skill.lower() for skill in resume_skills)
+        if isinstance(job_skills, (set, frozenset)):
+            job_set = job_skills
+        else:
+            job_set = set(skill.lower() for skill in job_skills)
+
         # Find matched skills
-        matched = resume_set.intersection(job_set)
+        matched = resume_set & job_set
         
         # Calculate match percentage
         match_score = len(matched) / len(job_set) if job_set else 0.0
         
-        return match_score, sorted(list(matched))
+        return match_score, sorted(matched)
     
     def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
         """
@@ -270,40 +716,10 @@ class SkillExtractor:
             'other': []
         }
         
-        # Define category keywords
-        prog_langs = {'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 
-                     'ruby', 'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r'}
-        
-        frameworks = {'react', 'angular', 'vue', 'django', 'flask', 'spring', 
-                     'nodejs', 'express', 'tensorflow', 'pytorch', 'keras'}
-        
-        databases = {'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 
-                    'oracle', 'sqlite', 'dynamodb', 'elasticsearch'}
-        
-        cloud = {'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible'}
-        
-        tools = {'git', 'github', 'gitlab', 'jenkins', 'ci/cd', 'linux', 'unix'}
-        
-        soft_skills = {'leadership', 'communication', 'teamwork', 'problem solving',
-                      'critical thinking', 'project management', 'agile', 'scrum'}
-        
-        # Categorize each skill
+        # One shared-dict lookup per skill
         for skill in skills:
-            skill_lower = skill.lower()
-            if skill_lower in prog_langs:
-                categories['programming_languages'].append(skill)
-            elif skill_lower in frameworks:
-                categories['frameworks'].append(skill)
-            elif skill_lower in databases:
-                categories['databases'].append(skill)
-            elif skill_lower in cloud:
-                categories['cloud'].append(skill)
-            elif skill_lower in tools:
-                categories['tools'].append(skill)
-            elif skill_lower in soft_skills:
-                categories['soft_skills'].append(skill)
-            else:
-                categories['other'].append(skill)
+            category = _SKILL_TO_CATEGORY.get(skill.lower(), 'other')
+            categories[category].append(skill)
         
         # Remove empty categories
         return {k: v for k, v in categories.items() if v}
@@ -318,44 +734,27 @@ class SkillExtractor:
         Returns:
             Dictionary with 'required' and 'preferred' skill lists
         """
-        result = {
-            'required': [],
-            'preferred': []
-        }
-        
-        # Patterns for required skills
-        required_patterns = [
-            r'(?:required|must\s+have|mandatory|essential)[:\s]+([^\.]+)',
-            r'requirements?[:\s]+([^\.]+)',
-        ]
-        
-        # Patterns for preferred skills
-        preferred_patterns = [
-            r'(?:preferred|nice\s+to\s+have|bonus|desired)[:\s]+([^\.]+)',
-            r'(?:plus|advantage)[:\s]+([^\.]+)',
-        ]
-        
+        # Accumulate straight into sets; _extract_by_keywords already
+        # returns sets, so the old list-extend-then-dedup churn is gone
+        required = set()
+        preferred = set()
+
         # Extract required skills
-        for pattern in required_patterns:
-            matches = re.findall(pattern, job_text, re.IGNORECASE)
-            for match in matches:
-                skills = self._extract_by_keywords(match)
-                result['required'].extend(skills)
+        for pattern in _REQUIRED_PATTERNS:
+            for match in pattern.findall(job_text):
+                required |= self._extract_by_keywords(match)
         
         # Extract preferred skills
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, job_text, re.IGNORECASE)
-            for match in matches:
-                skills = self._extract_by_keywords(match)
-                result['preferred'].extend(skills)
+        for pattern in _PREFERRED_PATTERNS:
+            for match in pattern.findall(job_text):
+                preferred |= self._extract_by_keywords(match)
         
         # If no specific sections found, all skills are considered required
-        if not result['required'] and not result['preferred']:
-            all_skills = self.extract_from_text(job_text)
-            result['required'] = all_skills
-        
-        # Remove duplicates
-        result['required'] = list(set(result['required']))
-        result['preferred'] = list(set(result['preferred']))
+        if not required and not preferred:
+            required = set(self.extract_from_text(job_text))
         
-        return result
+        # Lists only at the boundary, sorted for stable output
+        return {
+            'required': sorted(required),
+            'preferred': sorted(preferred)
+        }
@@ -0,0 +1,209 @@
+"""
+Vector index module for Resume Screening System.
+Provides approximate nearest-neighbor search over resume embeddings.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import List, Tuple
+import numpy as np
+import config
+
+# Import FAISS only when available to keep it an optional dependency
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except Exception:
+    FAISS_AVAILABLE = False
+    faiss = None
+
+
+class FaissIndex:
+    """
+    Approximate nearest-neighbor index over resume embeddings.
+
+    Uses a FAISS HNSW index when the faiss library is installed, turning
+    the exhaustive O(N·D) scan per screening into a logarithmic graph
+    search. Falls back to an exact NumPy scan otherwise, so callers get
+    the same interface either way.
+    """
+
+    def __init__(self, dimension: int, index_path: str = None, hnsw_m: int = 32):
+        """
+        Initialize the index.
+
+        Args:
+            dimension: Embedding dimension
+            index_path: Base path for persisting the index
+            hnsw_m: HNSW graph connectivity (FAISS only)
+        """
+        self.dimension = dimension
+        self.index_path = Path(index_path or config.VECTOR_INDEX_PATH)
+        self.hnsw_m = hnsw_m
+
+        # Maps index position -> resume_id
+        self.resume_ids: List[str] = []
+        self._indexed = set()
+
+        if FAISS_AVAILABLE:
+            self.index = faiss.IndexHNSWFlat(
+                dimension, hnsw_m, faiss.METRIC_INNER_PRODUCT
+            )
+            self._vectors = None
+        else:
+            self.index = None
+            self._vectors = np.zeros((0, dimension), dtype=np.float32)
+
+        self.load()
+
+    def __len__(self) -> int:
+        """Number of indexed vectors."""
+        return len(self.resume_ids)
+
+    def _normalize(self, vector: np.ndarray) -> np.ndarray:
+        """L2-normalize a vector so inner product equals cosine similarity."""
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        return vector
+
+    def add(self, resume_id: str, vector: np.ndarray):
+        """
+        Add a resume embedding to the index.
+
+        Args:
+            resume_id: Resume identifier
+            vector: Embedding vector
+        """
+        # HNSW graphs don't support removal, so re-uploads keep the
+        # original vector rather than accumulating duplicates
+        if resume_id in self._indexed:
+            return
+
+        vector = self._normalize(vector)
+
+        if self.index is not None:
+            self.index.add(vector)
+        else:
+            self._vectors = np.vstack([self._vectors, vector])
+
+        self.resume_ids.append(resume_id)
+        self._indexed.add(resume_id)
+
+    def add_batch(self, resume_ids: List[str], vectors: np.ndarray):
+        """
+        Add many embeddings in one call.
+
+        Bulk rebuilds go through a single faiss add over the whole
+        matrix instead of one graph insertion call per resume.
+
+        Args:
+            resume_ids: Resume identifiers, parallel to vectors rows
+            vectors: Embedding matrix of shape (n, dimension)
+        """
+        fresh = [
+            i for i, resume_id in enumerate(resume_ids)
+            if resume_id not in self._indexed
+        ]
+        if not fresh:
+            return
+
+        matrix = np.asarray(vectors, dtype=np.float32)[fresh]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1, norms)
+
+        if self.index is not None:
+            self.index.add(matrix)
+        else:
+            self._vectors = np.vstack([self._vectors, matrix])
+
+        for i in fresh:
+            self.resume_ids.append(resume_ids[i])
+            self._indexed.add(resume_ids[i])
+
+    def search(self, query: np.ndarray, top_k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Find the most similar indexed resumes to a query embedding.
+
+        Args:
+            query: Query embedding vector
+            top_k: Number of results to return
+
+        Returns:
+            List of (resume_id, similarity_score) tuples, best first
+        """
+        if not self.resume_ids:
+            return []
+
+        query = self._normalize(query)
+        top_k = min(top_k, len(self.resume_ids))
+
+        if self.index is not None:
+            scores, indices = self.index.search(query, top_k)
+            return [
+                (self.resume_ids[idx], float(score))
+                for idx, score in zip(indices[0], scores[0])
+                if idx >= 0
+            ]
+
+        # Exact fallback scan
+        similarities = self._vectors @ query[0]
+        order = np.argsort(similarities)[::-1][:top_k]
+        return [(self.resume_ids[idx], float(similarities[idx])) for idx in order]
+
+    def save(self):
+        """
+        Persist the index and its id mapping to disk.
+
+        Each file is written to a temp sibling and moved into place
+        with an atomic rename, so a save racing another writer (or a
+        crash mid-write) can never leave a truncated or interleaved
+        file for load() to choke on.
+        """
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.index is not None:
+            data_path = self.index_path.with_suffix('.faiss')
+            tmp_path = data_path.with_suffix('.faiss.tmp')
+            faiss.write_index(self.index, str(tmp_path))
+        else:
+            data_path = self.index_path.with_suffix('.npy')
+            tmp_path = data_path.with_suffix('.npy.tmp')
+            np.save(tmp_path, self._vectors)
+            # np.save appends .npy when the target lacks it
+            tmp_path = tmp_path.with_suffix('.tmp.npy')
+        os.replace(tmp_path, data_path)
+
+        # Vectors land before ids: a reader that sees the new ids file
+        # always finds at least as many vectors behind it
+        ids_path = self.index_path.with_suffix('.ids')
+        ids_tmp = ids_path.with_suffix('.ids.tmp')
+        with open(ids_tmp, 'wb') as f:
+            pickle.dump(self.resume_ids, f)
+        os.replace(ids_tmp, ids_path)
+
+    def load(self):
+        """Load a previously persisted index if one exists."""
+        ids_path = self.index_path.with_suffix('.ids')
+        if not ids_path.exists():
+            return
+
+        try:
+            with open(ids_path, 'rb') as f:
+                self.resume_ids = pickle.load(f)
+            self._indexed = set(self.resume_ids)
+
+            if self.index is not None:
+                faiss_path = self.index_path.with_suffix('.faiss')
+                if faiss_path.exists():
+                    self.index = faiss.read_index(str(faiss_path))
+            else:
+                npy_path = self.index_path.with_suffix('.npy')
+                if npy_path.exists():
+                    self._vectors = np.load(npy_path)
+        except Exception as e:
+            print(f"Warning: could not load vector index ({e}). Starting empty.")
+            self.resume_ids = []
+            self._indexed = set()
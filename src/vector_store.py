@@ -0,0 +1,118 @@
+"""
+Contiguous embedding storage for Resume Screening System.
+Keeps all resume vectors in one append-only float32 file so screening
+can memory-map them as a single (N, D) matrix instead of decoding
+per-row database blobs.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+import config
+
+
+class VectorStore:
+    """
+    Append-only file of fixed-width float32 vectors.
+
+    Each vector occupies one row; a row's offset (its index) is stored
+    alongside the record that owns it. Readers memory-map the whole file
+    once and slice rows out with zero-copy fancy indexing. Appends go
+    through O_APPEND, so concurrent writers -- threads or separate
+    worker processes -- always get distinct rows and correct offsets.
+    """
+
+    def __init__(self, dimension: int, store_path: str = None):
+        """
+        Initialize the vector store.
+
+        Args:
+            dimension: Embedding dimension (row width)
+            store_path: Path to the backing file
+                       Default: config.VECTOR_STORE_PATH
+        """
+        self.dimension = dimension
+        self.store_path = Path(store_path or config.VECTOR_STORE_PATH)
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self._row_bytes = dimension * np.dtype(np.float32).itemsize
+
+    def __len__(self) -> int:
+        """Number of vectors currently stored."""
+        if not self.store_path.exists():
+            return 0
+        return self.store_path.stat().st_size // self._row_bytes
+
+    def append(self, vector: np.ndarray) -> int:
+        """
+        Append a vector to the store.
+
+        Args:
+            vector: Embedding vector of shape (dimension,)
+
+        Returns:
+            Row offset of the stored vector
+        """
+        row = np.ascontiguousarray(vector, dtype=np.float32)
+        if row.shape != (self.dimension,):
+            raise ValueError(
+                f"Expected vector of shape ({self.dimension},), got {row.shape}"
+            )
+
+        payload = row.tobytes()
+
+        # O_APPEND makes the kernel place the write atomically at the
+        # current end of file, so appends from other threads or worker
+        # processes can never interleave with it or steal its slot. The
+        # offset comes from this fd's position after the write (which
+        # later appends by others do not move), not from a pre-write
+        # size read that another writer could race past.
+        fd = os.open(self.store_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            written = os.write(fd, payload)
+            if written != len(payload):
+                raise OSError(
+                    f"Short write to vector store: {written} of "
+                    f"{len(payload)} bytes"
+                )
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+        finally:
+            os.close(fd)
+
+        return end // self._row_bytes - 1
+
+    def load_all(self) -> np.ndarray:
+        """
+        Memory-map every stored vector as one matrix.
+
+        Returns:
+            Read-only array of shape (n_vectors, dimension); rows are
+            paged in lazily by the OS, so gathering a subset touches
+            only the bytes it needs
+        """
+        count = len(self)
+        if count == 0:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        return np.memmap(
+            self.store_path,
+            dtype=np.float32,
+            mode='r',
+            shape=(count, self.dimension)
+        )
+
+    def get(self, offset: int) -> Optional[np.ndarray]:
+        """
+        Fetch a single vector by its row offset.
+
+        Args:
+            offset: Row offset returned by append()
+
+        Returns:
+            Copy of the stored vector, or None for an invalid offset
+        """
+        if offset is None or offset < 0 or offset >= len(self):
+            return None
+        return np.array(self.load_all()[offset])
@@ -2,8 +2,13 @@
 Unit tests for Resume Screening System components.
 """
 
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
+
 import numpy as np
+from src.database import Database
 from src.preprocessing import TextPreprocessor
 from src.skill_extraction import SkillExtractor
 from src.embeddings import EmbeddingGenerator
@@ -72,6 +77,37 @@ class TestSkillExtractor(unittest.TestCase):
         self.assertIn('python', matched)
         self.assertIn('react', matched)
     
+    def test_keyword_matching_boundaries(self):
+        """Test that keyword matching respects word boundaries."""
+        # 'r' must not match inside 'rust' and 'go' not inside 'django',
+        # regardless of whether the automaton or regex path is active
+        skills = self.extractor.extract_from_text("We use rust and django daily")
+
+        self.assertIn('rust', skills)
+        self.assertIn('django', skills)
+        self.assertNotIn('r', skills)
+        self.assertNotIn('go', skills)
+
+    def test_keyword_matching_nonword_edges(self):
+        """Test that skills ending in +, # or / are matched."""
+        skills = self.extractor.extract_from_text("Fluent in C++ and C#, with ci/cd pipelines")
+
+        self.assertIn('c++', skills)
+        self.assertIn('c#', skills)
+        self.assertIn('ci/cd', skills)
+
+    def test_keyword_matcher_paths_agree(self):
+        """Test that the automaton and regex fallback find the same skills."""
+        text = "Proficient in Python and SQL; shipped react apps on AWS with docker."
+        regex_hits = set(self.extractor._skill_regex.findall(text.lower()))
+
+        self.assertEqual(self.extractor._extract_by_keywords(text), regex_hits)
+        if self.extractor.skill_automaton is not None:
+            self.assertEqual(
+                self.extractor._match_keywords_automaton(text.lower()),
+                regex_hits
+            )
+
     def test_categorize_skills(self):
         """Test skill categorization."""
         skills = ['python', 'javascript', 'react', 'postgresql', 'aws', 'docker']
@@ -81,6 +117,64 @@ class TestSkillExtractor(unittest.TestCase):
         self.assertIn('frameworks', categories)
 
 
+class TestDatabase(unittest.TestCase):
+    """Test cases for Database."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = Database(str(Path(self.tmpdir) / 'test.db'))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_commit_screening_batch_matches_python_ranking(self):
+        """Test that SQL-side ranking agrees with pre-ranked inserts."""
+        results = [
+            {'resume_id': 'r1', 'skill_match_score': 0.4,
+             'semantic_similarity_score': 0.5, 'experience_score': 0.6,
+             'overall_score': 0.45, 'matched_skills': ['python']},
+            {'resume_id': 'r2', 'skill_match_score': 0.9,
+             'semantic_similarity_score': 0.8, 'experience_score': 0.7,
+             'overall_score': 0.85, 'matched_skills': ['python', 'aws']},
+            {'resume_id': 'r3', 'skill_match_score': 0.6,
+             'semantic_similarity_score': 0.7, 'experience_score': 0.5,
+             'overall_score': 0.62, 'matched_skills': []},
+        ]
+        for row in results:
+            self.db.insert_resume({
+                'resume_id': row['resume_id'],
+                'candidate_name': f"Candidate {row['resume_id']}",
+                'content': 'resume text',
+            })
+
+        # Reference path: rank in Python, insert with explicit ranks
+        ranked = sorted(results, key=lambda r: r['overall_score'], reverse=True)
+        self.db.insert_screening_results_batch('job-python', [
+            dict(row, job_id='job-python', rank=i + 1)
+            for i, row in enumerate(ranked)
+        ])
+
+        # SQL path: same rows, unranked; ROW_NUMBER() assigns ranks
+        self.db.commit_screening_batch('job-sql', results)
+
+        expected = self.db.get_screening_results('job-python')
+        stored = self.db.get_screening_results('job-sql')
+
+        self.assertEqual(
+            [(row['resume_id'], row['rank']) for row in stored],
+            [(row['resume_id'], row['rank']) for row in expected]
+        )
+        self.assertEqual(
+            [row['overall_score'] for row in stored],
+            [row['overall_score'] for row in expected]
+        )
+        self.assertEqual(
+            [row['matched_skills'] for row in stored],
+            [row['matched_skills'] for row in expected]
+        )
+
+
 class TestEmbeddingGenerator(unittest.TestCase):
     """Test cases for EmbeddingGenerator."""
     
@@ -135,9 +229,9 @@ class TestEmbeddingGenerator(unittest.TestCase):
         serialized = self.generator.serialize_embedding(embedding)
         self.assertIsInstance(serialized, bytes)
         
-        # Deserialize
+        # Deserialize (stored as float16, so allow quantization error)
         deserialized = self.generator.deserialize_embedding(serialized)
-        self.assertTrue(np.allclose(embedding, deserialized))
+        self.assertTrue(np.allclose(embedding, deserialized, atol=1e-3))
 
 
 class TestCandidateScorer(unittest.TestCase):
@@ -205,6 +299,45 @@ class TestCandidateScorer(unittest.TestCase):
         self.assertEqual(ranked[1]['rank'], 2)
         self.assertEqual(ranked[2]['rank'], 3)
 
+    def test_zero_embedding_scores_zero_semantic(self):
+        """Test that zero embeddings score 0.0 on every scoring path."""
+        zero = np.zeros(4, dtype=np.float32)
+        job = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+
+        # Scalar baseline
+        self.assertEqual(self.scorer.calculate_semantic_similarity(zero, job), 0.0)
+
+        # Precomputed-similarity path: NaN flags the zero embedding
+        scoring = self.scorer.score_candidate(
+            {'extracted_skills': [], 'experience_years': 0},
+            {'required_skills': []},
+            semantic_similarity=float('nan')
+        )
+        self.assertEqual(scoring.semantic_similarity_score, 0.0)
+
+        # Batch path
+        batch = self.scorer.score_candidates_batch(
+            [[], []],
+            np.zeros(2, dtype=np.float32),
+            np.array([np.nan, 0.5], dtype=np.float32),
+            []
+        )
+        self.assertEqual(batch[0].semantic_similarity_score, 0.0)
+        self.assertEqual(batch[1].semantic_similarity_score, 0.75)
+
+    def test_rank_candidates_stable_ties(self):
+        """Test that equal scores keep their input order."""
+        candidates = [
+            {'resume_id': 'a', 'overall_score': 0.50},
+            {'resume_id': 'b', 'overall_score': 0.80},
+            {'resume_id': 'c', 'overall_score': 0.50},
+        ]
+
+        ranked = self.scorer.rank_candidates(candidates)
+
+        self.assertEqual([c['resume_id'] for c in ranked], ['b', 'a', 'c'])
+        self.assertEqual([c['rank'] for c in ranked], [1, 2, 3])
+
 
 def run_tests():
     """Run all tests."""
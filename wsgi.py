@@ -0,0 +1,15 @@
+"""
+WSGI entry point for running the Resume Screener API in production.
+
+The Werkzeug development server used by `python app_simple.py` is
+single-threaded, so ML-heavy requests fully serialize. Run this module
+under a production WSGI server instead:
+
+    gunicorn -w 4 --worker-class gthread --threads 4 --preload wsgi:application
+
+--preload loads the app (and the embedding model, once warmed) in the
+master process so forked workers share it copy-on-write rather than each
+holding their own copy.
+"""
+
+from app_simple import app as application